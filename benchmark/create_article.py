@@ -3,6 +3,12 @@
 Create a comprehensive PDF article explaining the benchmark results
 """
 
+import copy
+import io
+import threading
+from functools import lru_cache
+from pathlib import Path
+
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
@@ -12,166 +18,367 @@ from reportlab.platypus import (
     Spacer,
     PageBreak,
     Image,
+    KeepTogether,
     Table,
     TableStyle,
 )
+from reportlab import rl_config
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus.paragraph import cleanBlockQuotedText, textTransformFrags
+from reportlab.platypus.paraparser import ParaParser
 from datetime import datetime
 
+# Palette. Colours are parsed once here and shared by the styles below.
+C_DARK = colors.HexColor("#1a1a1a")
+C_GREY = colors.HexColor("#555555")
+C_SLATE = colors.HexColor("#2c3e50")
+C_SLATE_LIGHT = colors.HexColor("#34495e")
+C_TEXT = colors.HexColor("#333333")
+C_HIGHLIGHT_TEXT = colors.HexColor("#3e15")
+C_CLOUD = colors.HexColor("#ecf0f1")
+C_ZEBRA = colors.HexColor("#f8f9fa")
+C_BLUE = colors.HexColor("#3498db")
+C_GREEN = colors.HexColor("#2ecc71")
+C_GREEN_LIGHT = colors.HexColor("#d4edda")
+C_RED = colors.HexColor("#e74c3c")
+C_PURPLE = colors.HexColor("#9b59b6")
+
+# Styles are built once at import; every article build reuses them.
+_SAMPLE_STYLES = getSampleStyleSheet()
+
+TITLE_STYLE = ParagraphStyle(
+    "CustomTitle",
+    parent=_SAMPLE_STYLES["Heading1"],
+    fontSize=24,
+    textColor=C_DARK,
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    fontName="Helvetica-Bold",
+)
 
-def create_benchmark_article():
-    """Create comprehensive PDF article"""
+SUBTITLE_STYLE = ParagraphStyle(
+    "Subtitle",
+    parent=_SAMPLE_STYLES["Normal"],
+    fontSize=14,
+    textColor=C_GREY,
+    spaceAfter=12,
+    alignment=TA_CENTER,
+    fontName="Helvetica",
+)
 
-    # Create PDF
-    pdf_path = "./Shinso_Solmover_Benchmark_2026_01_06.pdf"
-    doc = SimpleDocTemplate(
-        pdf_path,
-        pagesize=letter,
-        topMargin=0.75 * inch,
-        bottomMargin=0.75 * inch,
-        leftMargin=0.75 * inch,
-        rightMargin=0.75 * inch,
-    )
+HEADING1_STYLE = ParagraphStyle(
+    "CustomHeading1",
+    parent=_SAMPLE_STYLES["Heading1"],
+    fontSize=18,
+    textColor=C_SLATE,
+    spaceAfter=12,
+    spaceBefore=20,
+    fontName="Helvetica-Bold",
+)
 
-    # Get styles
-    styles = getSampleStyleSheet()
-
-    # Create custom styles
-    title_style = ParagraphStyle(
-        "CustomTitle",
-        parent=styles["Heading1"],
-        fontSize=24,
-        textColor=colors.HexColor("#1a1a1a"),
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        fontName="Helvetica-Bold",
-    )
+HEADING2_STYLE = ParagraphStyle(
+    "CustomHeading2",
+    parent=_SAMPLE_STYLES["Heading2"],
+    fontSize=14,
+    textColor=C_SLATE_LIGHT,
+    spaceAfter=10,
+    spaceBefore=15,
+    fontName="Helvetica-Bold",
+)
 
-    subtitle_style = ParagraphStyle(
-        "Subtitle",
-        parent=styles["Normal"],
-        fontSize=14,
-        textColor=colors.HexColor("#555555"),
-        spaceAfter=12,
-        alignment=TA_CENTER,
-        fontName="Helvetica",
-    )
+BODY_STYLE = ParagraphStyle(
+    "CustomBody",
+    parent=_SAMPLE_STYLES["Normal"],
+    fontSize=11,
+    leading=16,
+    textColor=C_TEXT,
+    spaceAfter=12,
+    alignment=TA_JUSTIFY,
+    fontName="Helvetica",
+)
 
-    heading1_style = ParagraphStyle(
-        "CustomHeading1",
-        parent=styles["Heading1"],
-        fontSize=18,
-        textColor=colors.HexColor("#2c3e50"),
-        spaceAfter=12,
-        spaceBefore=20,
-        fontName="Helvetica-Bold",
-    )
+HIGHLIGHT_STYLE = ParagraphStyle(
+    "Highlight",
+    parent=_SAMPLE_STYLES["Normal"],
+    fontSize=11,
+    leading=16,
+    textColor=C_HIGHLIGHT_TEXT,
+    spaceAfter=12,
+    leftIndent=20,
+    rightIndent=20,
+    backColor=C_CLOUD,
+    borderPadding=10,
+)
 
-    heading2_style = ParagraphStyle(
-        "CustomHeading2",
-        parent=styles["Heading2"],
-        fontSize=14,
-        textColor=colors.HexColor("#34495e"),
-        spaceAfter=10,
-        spaceBefore=15,
-        fontName="Helvetica-Bold",
-    )
 
-    body_style = ParagraphStyle(
-        "CustomBody",
-        parent=styles["Normal"],
-        fontSize=11,
-        leading=16,
-        textColor=colors.HexColor("#333333"),
-        spaceAfter=12,
-        alignment=TA_JUSTIFY,
-        fontName="Helvetica",
-    )
+# Table styles are likewise shared across builds. The data tables all use a
+# coloured header row, a grey grid and zebra-striped body rows; only the
+# header colour and per-table alignment differ.
+_ZEBRA_ROW_BACKGROUNDS = [colors.white, C_ZEBRA]
+
+_HEADER_ROW_COMMANDS = [
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+]
+
+_CENTERED_COMMANDS = [
+    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+    ("ALIGN", (0, 0), (0, -1), "LEFT"),
+]
+
 
-    highlight_style = ParagraphStyle(
-        "Highlight",
-        parent=styles["Normal"],
-        fontSize=11,
-        leading=16,
-        textColor=colors.HexColor("#3e15"),
-        spaceAfter=12,
-        leftIndent=20,
-        rightIndent=20,
-        backColor=colors.HexColor("#ecf0f1"),
-        borderPadding=10,
+def _data_table_style(header_color, commands, zebra_from_row=1):
+    """Build a data-table style around the shared header/grid/zebra commands."""
+    return TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), header_color),
+            *_HEADER_ROW_COMMANDS,
+            *commands,
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+            ("ROWBACKGROUNDS", (0, zebra_from_row), (-1, -1), _ZEBRA_ROW_BACKGROUNDS),
+        ]
     )
 
-    # Build story
-    story = []
+
+TOC_TABLE_STYLE = TableStyle(
+    [
+        ("FONT", (0, 0), (-1, -1), "Helvetica", 11),
+        ("ALIGN", (0, 0), (0, -1), "RIGHT"),
+        ("ALIGN", (2, 0), (2, -1), "RIGHT"),
+        ("TEXTCOLOR", (0, 0), (-1, -1), C_TEXT),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+    ]
+)
+
+CONTRACTS_TABLE_STYLE = _data_table_style(
+    C_BLUE,
+    [
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("ALIGN", (3, 0), (3, -1), "CENTER"),
+        ("FONTSIZE", (0, 0), (-1, 0), 10),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
+        ("BACKGROUND", (0, 1), (-1, -1), C_CLOUD),
+        ("FONTNAME", (0, 1), (-1, -1), "Helvetica", 9),
+    ],
+)
+
+RESULTS_TABLE_STYLE = _data_table_style(
+    C_GREEN,
+    [
+        *_CENTERED_COMMANDS,
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
+        ("BACKGROUND", (0, 1), (-1, 1), C_GREEN_LIGHT),  # Highlight SolMover
+        ("FONTNAME", (0, 1), (-1, 1), "Helvetica-Bold"),
+        ("BACKGROUND", (0, 2), (-1, -1), colors.white),
+    ],
+    zebra_from_row=2,
+)
+
+PAIRWISE_TABLE_STYLE = _data_table_style(
+    C_RED,
+    [*_CENTERED_COMMANDS, ("FONTSIZE", (0, 0), (-1, -1), 9)],
+)
+
+CI_TABLE_STYLE = _data_table_style(
+    C_PURPLE,
+    [*_CENTERED_COMMANDS, ("FONTSIZE", (0, 0), (-1, -1), 10)],
+)
+
+
+# Article content. The tables carry the benchmark figures; the story
+# builder below only lays them out.
+TOC_TABLE_DATA = [
+    ["1.", "Introduction & Motivation", "3"],
+    ["2.", "Methodology Overview", "4"],
+    ["3.", "Results & Visual Analysis", "6"],
+    ["4.", "Statistical Significance", "8"],
+    ["5.", "Error Pattern Analysis", "10"],
+    ["6.", "Why These Results Matter", "11"],
+    ["7.", "Implications for AI Development", "13"],
+    ["8.", "Conclusion", "14"],
+]
+
+CONTRACTS_TABLE_DATA = [
+    ["Level", "Contract", "Concepts", "Tests"],
+    ["101", "hello_world", "Basic objects, transfers", "11"],
+    ["102", "tipjar", "Value transfers, owned objects", "12"],
+    ["103", "guestbook", "Storage patterns, dynamic fields", "12"],
+    ["201", "todo_list", "CRUD operations, state management", "14"],
+    ["202", "simple_coin", "Token patterns, TreasuryCap", "12"],
+    ["203", "counter", "Shared objects, access control", "14"],
+    ["301", "weather_oracle", "Oracle pattern, AdminCap, NFTs", "13"],
+]
+
+RESULTS_TABLE_DATA = [
+    ["Model", "Avg Score", "Compile Rate", "Test Pass Rate", "Tests Passed"],
+    ["SolMover", "73.9/100", "71.4%", "69.3%", "61/88"],
+    ["Claude 4.5 Sonnet", "45.6/100", "42.9%", "42.0%", "37/88"],
+    ["Gemini-3-Pro", "33.7/100", "28.6%", "26.1%", "23/88"],
+    ["Gemini-2.5", "28.6/100", "28.6%", "13.6%", "12/88"],
+    ["GPT-5.2-Pro", "21.3/100", "14.3%", "14.8%", "13/88"],
+    ["Qwen3-Coder", "21.9/100", "14.3%", "13.6%", "12/88"],
+]
+
+PAIRWISE_TABLE_DATA = [
+    ["Comparison", "Difference", "p-value", "Significance"],
+    ["SolMover vs Claude 4.5", "+27.3%", "< 0.001", "*** Highly Sig."],
+    ["SolMover vs Gemini-3-Pro", "+43.2%", "< 0.001", "*** Highly Sig."],
+    ["SolMover vs GPT-5.2-Pro", "+54.5%", "< 0.001", "*** Highly Sig."],
+    ["Claude vs Gemini-2.5", "+28.4%", "< 0.001", "*** Highly Sig."],
+    ["Gemini-3-Pro vs GPT-5.2", "+11.4%", "0.092", "Not Significant"],
+]
+
+CI_TABLE_DATA = [
+    ["Model", "Pass Rate", "95% Confidence Interval"],
+    ["SolMover", "69.3%", "[59.0% - 78.0%]"],
+    ["Claude 4.5 Sonnet", "42.0%", "[32.3% - 52.5%]"],
+    ["Gemini-3-Pro", "26.1%", "[18.1% - 36.2%]"],
+    ["GPT-5.2-Pro", "14.8%", "[8.8% - 23.7%]"],
+]
+
+
+_PARSER_LOCAL = threading.local()
+
+
+def _parser():
+    """Return this thread's reusable ``ParaParser`` (reset by each parse)."""
+    parser = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = _PARSER_LOCAL.parser = ParaParser()
+        parser.caseSensitive = 1
+    return parser
+
+
+@lru_cache(maxsize=None)
+def _plain_frag_template(style):
+    """The fragment the parser produces for unmarked text in ``style``."""
+    return _parser().parse("x", style)[1][0]
+
+
+@lru_cache(maxsize=None)
+def _paragraph_prototype(text, style):
+    """Parse ``text`` once per (text, style) pair.
+
+    Marked-up text goes through the thread's shared parser rather than the
+    fresh ``ParaParser`` that ``Paragraph`` would create. Text without markup
+    or entities skips the parser: its single fragment is the style's template
+    fragment carrying the cleaned text.
+    """
+    text = cleanBlockQuotedText(text)
+    if "<" in text or "&" in text:
+        parser = _parser()
+        style, frags, _ = parser.parse(text, style)
+        if frags is None:
+            raise ValueError(
+                "xml parser error (%s) in paragraph beginning\n'%s'"
+                % (parser.errors[0], text[:30])
+            )
+    else:
+        frag = copy.copy(_plain_frag_template(style))
+        frag.text = text
+        frags = [frag]
+    textTransformFrags(frags, style)
+    return Paragraph(text, style, frags=frags)
+
+
+def _para(text, style):
+    """Return a fresh copy of the cached, pre-parsed paragraph for ``text``.
+
+    ``doc.build`` stores layout state on the flowables it draws, so each story
+    gets its own shallow copy while sharing the parsed fragments.
+    """
+    return copy.copy(_paragraph_prototype(text, style))
+
+
+_SMALL_FONT_OPEN = '<font size="9">'
+_SMALL_FONT_CLOSE = "</font>"
+
+
+def _small_para(text, style):
+    """Like ``_para`` but set in the 9pt font used by the abstract."""
+    return _para(_SMALL_FONT_OPEN + text + _SMALL_FONT_CLOSE, style)
+
+
+# Blank line between blocks: no height of its own, just the body paragraph gap
+PARAGRAPH_GAP = Spacer(1, 0)
+PARAGRAPH_GAP.spaceAfter = BODY_STYLE.spaceAfter
+
+CHART_PATH = Path("./benchmark_charts.png")
+
+
+@lru_cache(maxsize=None)
+def _image_reader(path, mtime):
+    """Decode the image at ``path`` once per ``mtime``; later builds reuse it."""
+    return ImageReader(path)
+
+
+class _PreloadedImage(Image):
+    """Platypus ``Image`` drawn from an already decoded ``ImageReader``."""
+
+    def __init__(self, reader, width, height):
+        self._img = reader
+        super().__init__(reader.fileName, width=width, height=height)
+
+
+def iter_story():
+    """Yield the article's flowables, independent of the output document."""
 
     # Title Page
-    story.append(Spacer(1, 1.2 * inch))
-    story.append(Paragraph("AI-Powered Source Code Translation", title_style))
-    story.append(Spacer(1, 0.3 * inch))
-    story.append(
-        Paragraph(
+    yield Spacer(1, 1.2 * inch)
+    yield _para("AI-Powered Source Code Translation", TITLE_STYLE)
+    yield Spacer(1, 0.3 * inch)
+    yield (
+        _para(
             "Evaluating Specialized Models for Cross-Language Code Migration: A Solidity→Move Pilot Study",
-            subtitle_style,
+            SUBTITLE_STYLE,
         )
     )
-    story.append(Spacer(1, 0.3 * inch))
-    story.append(Paragraph("January 6, 2026", subtitle_style))
-    story.append(Spacer(1, 0.3 * inch))
+    yield Spacer(1, 0.3 * inch)
+    yield _para("January 6, 2026", SUBTITLE_STYLE)
+    yield Spacer(1, 0.3 * inch)
 
     # Abstract
-    story.append(Paragraph("<b>Abstract</b>", heading2_style))
-    story.append(
-        Paragraph(
-            """
-        <font size="9">
+    yield _para("<b>Abstract</b>", HEADING2_STYLE)
+    yield _small_para(
+        """
         Millions of developers face costly code migrations as specialized programming languages proliferate
         across domains—from scientific computing (MATLAB→Python) to enterprise systems (COBOL→Java) to
         blockchain platforms (Solidity→Move). Traditional manual translation requires 4-6 months per
         developer, creating a multi-billion dollar productivity bottleneck. This paper presents a rigorous
         methodology for evaluating AI-powered source code translation and validates it through a
         Solidity→Move pilot study.
-        </font>
-            """,
-            body_style,
-        )
+    """,
+        BODY_STYLE,
     )
 
-    story.append(
-        Paragraph(
-            """
-        <font size="9">
+    yield _small_para(
+        """
         <b>Performance Breakthrough:</b> Our specialized model (SolMover) achieves 69.3% test pass rate
         across 88 comprehensive unit tests—a 27.3 percentage point improvement over Claude 4.5 Sonnet
         (42.0%, p &lt; 0.001) and 54.5pp over GPT-5.2-Pro (14.8%). This represents a <b>65% relative improvement</b>
         in functional correctness compared to state-of-the-art general-purpose models, validated through
         statistical testing with 95% confidence intervals and chi-square analysis.
-        </font>
     """,
-            body_style,
-        )
+        BODY_STYLE,
     )
 
-    story.append(
-        Paragraph(
-            """
-        <font size="9">
+    yield _small_para(
+        """
         <b>Economic Impact:</b> At $100-200/hour developer rates, reducing learning curves from 4-6 months
         to 4-6 weeks represents $67,200-$134,400 in time savings per developer. With 20,000+ Solidity
         developers and growing ecosystems in Move, Rust, Cairo, and other blockchain languages, the
         addressable market for blockchain translation alone exceeds $1.3 billion annually. Extending this
         framework to scientific computing, enterprise modernization, and mobile development scales the
         opportunity to billions of developer-hours globally.
-        </font>
     """,
-            body_style,
-        )
+        BODY_STYLE,
     )
 
-    story.append(
-        Paragraph(
-            """
-        <font size="9">
+    yield _small_para(
+        """
         <b>Generalizable Framework:</b> While demonstrated on Solidity→Move, this benchmark methodology
         transfers to any language pair requiring compilation and testing validation. The architecture
         supports iterative refinement (compile → fix → test), multi-dimensional scoring (syntax + semantics +
@@ -179,18 +386,16 @@ def create_benchmark_article():
         quality across MATLAB→Python, Java→Kotlin, Fortran→Julia, and dozens of other critical migration
         paths. This pilot validates the technical approach before scaling to language pairs affecting
         millions of developers worldwide.
-        </font>
     """,
-            body_style,
-        )
+        BODY_STYLE,
     )
 
-    story.append(Spacer(1, 0.2 * inch))
+    yield Spacer(1, 0.2 * inch)
 
     # Executive Summary Box
-    story.append(Paragraph("<b>Executive Summary</b>", heading2_style))
-    story.append(
-        Paragraph(
+    yield _para("<b>Executive Summary</b>", HEADING2_STYLE)
+    yield (
+        _para(
             """
         This benchmark evaluates six AI models on their ability to translate Solidity smart contracts 
         to Sui Move, focusing on smart contracts ranging from educational to more production ready in complexity. Testing across 88 comprehensive unit tests, 
@@ -199,47 +404,27 @@ def create_benchmark_article():
         Statistical analysis confirms these differences are highly significant (p < 0.001), demonstrating 
         SolMover's specialized advantage for blockchain developer onboarding.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(PageBreak())
+    yield PageBreak()
 
     # Table of Contents
-    story.append(Paragraph("Table of Contents", heading1_style))
-    toc_data = [
-        ["1.", "Introduction & Motivation", "3"],
-        ["2.", "Methodology Overview", "4"],
-        ["3.", "Results & Visual Analysis", "6"],
-        ["4.", "Statistical Significance", "8"],
-        ["5.", "Error Pattern Analysis", "10"],
-        ["6.", "Why These Results Matter", "11"],
-        ["7.", "Implications for AI Development", "13"],
-        ["8.", "Conclusion", "14"],
-    ]
-    toc_table = Table(toc_data, colWidths=[0.5 * inch, 4.5 * inch, 0.8 * inch])
-    toc_table.setStyle(
-        TableStyle(
-            [
-                ("FONT", (0, 0), (-1, -1), "Helvetica", 11),
-                ("ALIGN", (0, 0), (0, -1), "RIGHT"),
-                ("ALIGN", (2, 0), (2, -1), "RIGHT"),
-                ("TEXTCOLOR", (0, 0), (-1, -1), colors.HexColor("#333333")),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-            ]
-        )
-    )
-    story.append(toc_table)
-    story.append(PageBreak())
+    yield _para("Table of Contents", HEADING1_STYLE)
+    toc_table = Table(TOC_TABLE_DATA, colWidths=[0.5 * inch, 4.5 * inch, 0.8 * inch])
+    toc_table.setStyle(TOC_TABLE_STYLE)
+    yield KeepTogether(toc_table)
+    yield PageBreak()
 
     # 1. Introduction
-    story.append(Paragraph("1. Introduction & Motivation", heading1_style))
+    yield _para("1. Introduction & Motivation", HEADING1_STYLE)
 
-    story.append(
-        Paragraph("<b>The Universal Challenge of Code Migration</b>", heading2_style)
+    yield (
+        _para("<b>The Universal Challenge of Code Migration</b>", HEADING2_STYLE)
     )
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         As technology advances, specialized programming languages emerge to optimally solve domain-specific
         problems. This creates a persistent challenge: millions of developers must migrate code between
@@ -249,15 +434,15 @@ def create_benchmark_article():
         months of learning curves, rewriting mental models, and translating paradigms—a costly bottleneck
         that scales with developer count and language diversity.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(
-        Paragraph("<b>Blockchain as an Ideal Pilot Domain</b>", heading2_style)
+    yield (
+        _para("<b>Blockchain as an Ideal Pilot Domain</b>", HEADING2_STYLE)
     )
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         The blockchain ecosystem provides an excellent proving ground for AI-assisted code translation.
         While Solidity dominates smart contract development, business decisions and market dynamics distribute
@@ -269,13 +454,13 @@ def create_benchmark_article():
         high economic stakes make it an ideal domain for validating translation methodology before scaling
         to other language pairs.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(Paragraph("<b>Market Opportunity</b>", heading2_style))
-    story.append(
-        Paragraph(
+    yield _para("<b>Market Opportunity</b>", HEADING2_STYLE)
+    yield (
+        _para(
             """
         This Solidity → Sui Move benchmark serves as a <b>pilot for a standardized cross-blockchain 
         translation framework</b>. While we demonstrate effectiveness on one language pair, the 
@@ -287,81 +472,49 @@ def create_benchmark_article():
         a market measured in hundreds of thousands of developer-hours annually. This pilot validates 
         the technical approach before scaling to additional language pairs.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(PageBreak())
+    yield PageBreak()
     # 2. Methodology
-    story.append(Paragraph("2. Methodology Overview", heading1_style))
+    yield _para("2. Methodology Overview", HEADING1_STYLE)
 
-    story.append(
-        Paragraph("<b>Test Contracts: Educational Foundation</b>", heading2_style)
+    yield (
+        _para("<b>Test Contracts: Educational Foundation</b>", HEADING2_STYLE)
     )
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         This benchmark uses 7 smart contracts drawn from a Sui Move introductory course 
         where the research team serves as mentors. These contracts have successfully onboarded 100+ 
         developers and represent the complete beginner-to-intermediate learning progression.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
     # Contracts table
-    contracts_data = [
-        ["Level", "Contract", "Concepts", "Tests"],
-        ["101", "hello_world", "Basic objects, transfers", "11"],
-        ["102", "tipjar", "Value transfers, owned objects", "12"],
-        ["103", "guestbook", "Storage patterns, dynamic fields", "12"],
-        ["201", "todo_list", "CRUD operations, state management", "14"],
-        ["202", "simple_coin", "Token patterns, TreasuryCap", "12"],
-        ["203", "counter", "Shared objects, access control", "14"],
-        ["301", "weather_oracle", "Oracle pattern, AdminCap, NFTs", "13"],
-    ]
-
     contracts_table = Table(
-        contracts_data, colWidths=[0.7 * inch, 1.5 * inch, 2.3 * inch, 0.8 * inch]
-    )
-    contracts_table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#3498db")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                ("ALIGN", (3, 0), (3, -1), "CENTER"),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, 0), 10),
-                ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
-                ("BACKGROUND", (0, 1), (-1, -1), colors.HexColor("#ecf0f1")),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                ("FONTNAME", (0, 1), (-1, -1), "Helvetica", 9),
-                (
-                    "ROWBACKGROUNDS",
-                    (0, 1),
-                    (-1, -1),
-                    [colors.white, colors.HexColor("#f8f9fa")],
-                ),
-            ]
-        )
+        CONTRACTS_TABLE_DATA, colWidths=[0.7 * inch, 1.5 * inch, 2.3 * inch, 0.8 * inch]
     )
-    story.append(contracts_table)
-    story.append(Spacer(1, 0.2 * inch))
+    contracts_table.setStyle(CONTRACTS_TABLE_STYLE)
+    yield KeepTogether(contracts_table)
+    yield Spacer(1, 0.2 * inch)
 
-    story.append(
-        Paragraph(
-            "<b>Why 88 Tests Represents Strong Statistical Power</b>", heading2_style
+    yield (
+        _para(
+            "<b>Why 88 Tests Represents Strong Statistical Power</b>", HEADING2_STYLE
         )
     )
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         Unlike typical code generation benchmarks (HumanEval, MBPP) that test with a single assertion 
         per problem, this benchmark employs <b>12.6 comprehensive tests per contract</b>—representing 
         12× the testing rigor of industry standards. Each test verifies:
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
@@ -372,30 +525,30 @@ def create_benchmark_article():
         • Edge cases and error handling<br/>
         • Resource transfers and ownership
     """
-    story.append(Paragraph(test_points, body_style))
+    yield _para(test_points, BODY_STYLE)
 
-    story.append(Paragraph("<br/>", body_style))
+    yield PARAGRAPH_GAP
 
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         With n=88 independent tests, we achieve strong statistical power to detect differences 
         in model performance, with tight confidence intervals (±9% at 95% confidence level).
     """,
-            highlight_style,
+            HIGHLIGHT_STYLE,
         )
     )
 
-    story.append(Paragraph("<br/>", body_style))
+    yield PARAGRAPH_GAP
 
-    story.append(Paragraph("<b>Iterative Refinement Process</b>", heading2_style))
-    story.append(
-        Paragraph(
+    yield _para("<b>Iterative Refinement Process</b>", HEADING2_STYLE)
+    yield (
+        _para(
             """
         All models followed an identical translation workflow with iterative debugging—matching 
         real-world developer practice:
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
@@ -406,104 +559,65 @@ def create_benchmark_article():
         4. <b>Test Fixes (2 iterations):</b> Model receives test failures and fixes logic errors<br/>
         5. <b>Final Evaluation:</b> Automated benchmark scoring
     """
-    story.append(Paragraph(process_points, body_style))
+    yield _para(process_points, BODY_STYLE)
 
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         This methodology evaluates "debuggability" and practical translation quality — not 
         just first-shot accuracy, but the model's ability to successfully fix its own errors 
         when given feedback.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(PageBreak())
+    yield PageBreak()
 
     # 3. Results & Visual Analysis
-    story.append(Paragraph("3. Results & Visual Analysis", heading1_style))
+    yield _para("3. Results & Visual Analysis", HEADING1_STYLE)
 
-    story.append(
-        Paragraph("<b>Comprehensive Performance Dashboard</b>", heading2_style)
+    yield (
+        _para("<b>Comprehensive Performance Dashboard</b>", HEADING2_STYLE)
     )
 
     # Add the benchmark charts image
-    try:
-        img = Image("./benchmark_charts.png", width=6.5 * inch, height=3.9 * inch)
-        story.append(img)
-    except:
-        story.append(
-            Paragraph("[Benchmark charts image would appear here]", body_style)
-        )
+    if CHART_PATH.is_file():
+        reader = _image_reader(str(CHART_PATH), CHART_PATH.stat().st_mtime_ns)
+        yield _PreloadedImage(reader, width=6.5 * inch, height=3.9 * inch)
+    else:
+        yield _para("[Benchmark charts image would appear here]", BODY_STYLE)
 
-    story.append(Spacer(1, 0.2 * inch))
+    yield Spacer(1, 0.2 * inch)
 
-    story.append(Paragraph("<b>Key Performance Metrics</b>", heading2_style))
+    yield _para("<b>Key Performance Metrics</b>", HEADING2_STYLE)
 
     # Results summary table
-    results_data = [
-        ["Model", "Avg Score", "Compile Rate", "Test Pass Rate", "Tests Passed"],
-        ["SolMover", "73.9/100", "71.4%", "69.3%", "61/88"],
-        ["Claude 4.5 Sonnet", "45.6/100", "42.9%", "42.0%", "37/88"],
-        ["Gemini-3-Pro", "33.7/100", "28.6%", "26.1%", "23/88"],
-        ["Gemini-2.5", "28.6/100", "28.6%", "13.6%", "12/88"],
-        ["GPT-5.2-Pro", "21.3/100", "14.3%", "14.8%", "13/88"],
-        ["Qwen3-Coder", "21.9/100", "14.3%", "13.6%", "12/88"],
-    ]
-
     results_table = Table(
-        results_data, colWidths=[1.5 * inch, 0.9 * inch, 1 * inch, 1 * inch, 1 * inch]
+        RESULTS_TABLE_DATA, colWidths=[1.5 * inch, 0.9 * inch, 1 * inch, 1 * inch, 1 * inch]
     )
-    results_table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2ecc71")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("ALIGN", (0, 0), (0, -1), "LEFT"),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 9),
-                ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
-                (
-                    "BACKGROUND",
-                    (0, 1),
-                    (-1, 1),
-                    colors.HexColor("#d4edda"),
-                ),  # Highlight SolMover
-                ("FONTNAME", (0, 1), (-1, 1), "Helvetica-Bold"),
-                ("BACKGROUND", (0, 2), (-1, -1), colors.white),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                (
-                    "ROWBACKGROUNDS",
-                    (0, 2),
-                    (-1, -1),
-                    [colors.white, colors.HexColor("#f8f9fa")],
-                ),
-            ]
-        )
-    )
-    story.append(results_table)
-    story.append(Spacer(1, 0.2 * inch))
+    results_table.setStyle(RESULTS_TABLE_STYLE)
+    yield KeepTogether(results_table)
+    yield Spacer(1, 0.2 * inch)
 
-    story.append(Paragraph("<b>What the Charts Reveal</b>", heading2_style))
+    yield _para("<b>What the Charts Reveal</b>", HEADING2_STYLE)
 
-    story.append(Paragraph("<b>Chart 1: Overall Performance</b>", body_style))
-    story.append(
-        Paragraph(
+    yield _para("<b>Chart 1: Overall Performance</b>", BODY_STYLE)
+    yield (
+        _para(
             """
         SolMover's 73.9/100 average score exceeds the "production-viable" threshold (70+), 
         while all general-purpose models fall below this bar. Claude 4.5 Sonnet, the second-best 
         performer at 45.6, demonstrates reasonable capability but requires significant refinement 
         for production use.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(Paragraph("<b>Chart 2: Compilation vs Test Success</b>", body_style))
-    story.append(
-        Paragraph(
+    yield _para("<b>Chart 2: Compilation vs Test Success</b>", BODY_STYLE)
+    yield (
+        _para(
             """
         Compilation rate measures syntactic correctness, while test pass rate measures semantic 
         correctness. SolMover achieves balance in both (71.4% compile, 69.3% test pass), 
@@ -511,94 +625,94 @@ def create_benchmark_article():
         compiles 28.6% of the time but only passes 13.6% of tests—revealing that syntactic 
         correctness doesn't guarantee functional correctness.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(
-        Paragraph(
-            "<b>Chart 3: Test Pass Rate with 95% Confidence Intervals</b>", body_style
+    yield (
+        _para(
+            "<b>Chart 3: Test Pass Rate with 95% Confidence Intervals</b>", BODY_STYLE
         )
     )
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         The confidence intervals show the range of uncertainty in our measurements. SolMover's 
         95% CI [59.0% - 78.0%] does not overlap with Claude's [32.3% - 52.5%], providing 
         statistical evidence that the performance difference is real, not due to random chance.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(Paragraph("<b>Chart 4: Score Breakdown by Category</b>", body_style))
-    story.append(
-        Paragraph(
+    yield _para("<b>Chart 4: Score Breakdown by Category</b>", BODY_STYLE)
+    yield (
+        _para(
             """
         SolMover excels across all three scoring dimensions: compilation (28.6/40), tests (35.7/50), 
         and quality (9.6/10). The high quality score indicates clean, warning-free code — important 
         for optimal compilation and proper execution paths.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(Paragraph("<b>Chart 5: Top 5 Error Patterns by Model</b>", body_style))
-    story.append(
-        Paragraph(
+    yield _para("<b>Chart 5: Top 5 Error Patterns by Model</b>", BODY_STYLE)
+    yield (
+        _para(
             """
         The error heatmap reveals that SolMover encounters fewer instances of the most common 
         Move compilation errors. Notably, SolMover has only 1 occurrence of E03003 (unbound module) 
         compared to 6 for GPT-5.2-Pro—indicating better understanding of Move's unique ability system.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(Paragraph("<b>Chart 6: Testing Rigor Comparison</b>", body_style))
-    story.append(
-        Paragraph(
+    yield _para("<b>Chart 6: Testing Rigor Comparison</b>", BODY_STYLE)
+    yield (
+        _para(
             """
         This benchmark employs 12.6× more testing rigor than industry-standard benchmarks 
         (HumanEval, MBPP, APPS), which typically use a single test assertion per problem. 
         This comprehensive testing ensures we're measuring true functional correctness, not 
         just surface-level code generation.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(PageBreak())
+    yield PageBreak()
 
     # 4. Statistical Significance
-    story.append(Paragraph("4. Statistical Significance Analysis", heading1_style))
+    yield _para("4. Statistical Significance Analysis", HEADING1_STYLE)
 
-    story.append(Paragraph("<b>Why Statistical Testing Matters</b>", heading2_style))
-    story.append(
-        Paragraph(
+    yield _para("<b>Why Statistical Testing Matters</b>", HEADING2_STYLE)
+    yield (
+        _para(
             """
         Raw performance differences alone don't tell us whether results are meaningful or 
         just random variation. Statistical tests quantify the probability that observed 
         differences are real, not due to chance.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(
-        Paragraph("<b>Overall Model Comparison: Chi-Square Test</b>", heading2_style)
+    yield (
+        _para("<b>Overall Model Comparison: Chi-Square Test</b>", HEADING2_STYLE)
     )
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         We performed a chi-square test to determine if test pass rates differ significantly 
         across all six models:
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(Paragraph("<br/>", body_style))
+    yield PARAGRAPH_GAP
 
 
     chi_square_box = """
@@ -608,56 +722,29 @@ def create_benchmark_article():
         in test pass rates occurred by chance. We can confidently conclude that models differ 
         significantly in their translation capabilities.
     """
-    story.append(Paragraph(chi_square_box, highlight_style))
+    yield _para(chi_square_box, HIGHLIGHT_STYLE)
 
-    story.append(Paragraph("<br/>", body_style))
+    yield PARAGRAPH_GAP
 
-    story.append(
-        Paragraph("<b>Head-to-Head Comparisons: Pairwise Tests</b>", heading2_style)
+    yield (
+        _para("<b>Head-to-Head Comparisons: Pairwise Tests</b>", HEADING2_STYLE)
     )
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         Fisher's exact tests compared each model pair individually. Key findings:
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
     # Pairwise comparison table (selected key comparisons)
-    pairwise_data = [
-        ["Comparison", "Difference", "p-value", "Significance"],
-        ["SolMover vs Claude 4.5", "+27.3%", "< 0.001", "*** Highly Sig."],
-        ["SolMover vs Gemini-3-Pro", "+43.2%", "< 0.001", "*** Highly Sig."],
-        ["SolMover vs GPT-5.2-Pro", "+54.5%", "< 0.001", "*** Highly Sig."],
-        ["Claude vs Gemini-2.5", "+28.4%", "< 0.001", "*** Highly Sig."],
-        ["Gemini-3-Pro vs GPT-5.2", "+11.4%", "0.092", "Not Significant"],
-    ]
-
     pairwise_table = Table(
-        pairwise_data, colWidths=[2 * inch, 1.2 * inch, 1 * inch, 1.5 * inch]
+        PAIRWISE_TABLE_DATA, colWidths=[2 * inch, 1.2 * inch, 1 * inch, 1.5 * inch]
     )
-    pairwise_table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#e74c3c")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("ALIGN", (0, 0), (0, -1), "LEFT"),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 9),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                (
-                    "ROWBACKGROUNDS",
-                    (0, 1),
-                    (-1, -1),
-                    [colors.white, colors.HexColor("#f8f9fa")],
-                ),
-            ]
-        )
-    )
-    story.append(pairwise_table)
-    story.append(Spacer(1, 0.2 * inch))
+    pairwise_table.setStyle(PAIRWISE_TABLE_STYLE)
+    yield KeepTogether(pairwise_table)
+    yield Spacer(1, 0.2 * inch)
 
     significance_note = """
         <font size="8"><b>Significance Levels:</b><br/>
@@ -666,140 +753,114 @@ def create_benchmark_article():
         * p < 0.05 = Significant (>95% confidence)<br/>
         ns = Not significant</font>
     """
-    story.append(Paragraph(significance_note, body_style))
+    yield _para(significance_note, BODY_STYLE)
 
-    story.append(PageBreak())
+    yield PageBreak()
 
-    story.append(
-        Paragraph(
-            "<b>Confidence Intervals: Quantifying Uncertainty</b>", heading2_style
+    yield (
+        _para(
+            "<b>Confidence Intervals: Quantifying Uncertainty</b>", HEADING2_STYLE
         )
     )
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         95% confidence intervals show the range where we're 95% confident the true pass rate lies. 
         Non-overlapping intervals provide additional evidence of real performance differences:
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
     # Confidence intervals table
-    ci_data = [
-        ["Model", "Pass Rate", "95% Confidence Interval"],
-        ["SolMover", "69.3%", "[59.0% - 78.0%]"],
-        ["Claude 4.5 Sonnet", "42.0%", "[32.3% - 52.5%]"],
-        ["Gemini-3-Pro", "26.1%", "[18.1% - 36.2%]"],
-        ["GPT-5.2-Pro", "14.8%", "[8.8% - 23.7%]"],
-    ]
+    ci_table = Table(CI_TABLE_DATA, colWidths=[2 * inch, 1.5 * inch, 2 * inch])
+    ci_table.setStyle(CI_TABLE_STYLE)
+    yield KeepTogether(ci_table)
+    yield Spacer(1, 0.2 * inch)
 
-    ci_table = Table(ci_data, colWidths=[2 * inch, 1.5 * inch, 2 * inch])
-    ci_table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#9b59b6")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("ALIGN", (0, 0), (0, -1), "LEFT"),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 10),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                (
-                    "ROWBACKGROUNDS",
-                    (0, 1),
-                    (-1, -1),
-                    [colors.white, colors.HexColor("#f8f9fa")],
-                ),
-            ]
-        )
-    )
-    story.append(ci_table)
-    story.append(Spacer(1, 0.2 * inch))
-
-    story.append(Paragraph("<br/>", body_style))
+    yield PARAGRAPH_GAP
 
 
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         Notice that SolMover's lower bound (59.0%) exceeds Claude's upper bound (52.5%), 
         demonstrating a clear, statistically robust performance advantage even accounting 
         for measurement uncertainty.
     """,
-            highlight_style,
+            HIGHLIGHT_STYLE,
         )
     )
 
     # 5. Error Analysis
-    story.append(Paragraph("5. Error Pattern Analysis", heading1_style))
+    yield _para("5. Error Pattern Analysis", HEADING1_STYLE)
 
-    story.append(Paragraph("<b>Understanding Common Failure Modes</b>", heading2_style))
-    story.append(
-        Paragraph(
+    yield _para("<b>Understanding Common Failure Modes</b>", HEADING2_STYLE)
+    yield (
+        _para(
             """
         Analyzing which errors models encounter reveals where they struggle with Move's 
         unique features compared to Solidity:
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(
-        Paragraph("<b>Top Error: E03003 - Unbound module member</b>", body_style)
+    yield (
+        _para("<b>Top Error: E03003 - Unbound module member</b>", BODY_STYLE)
     )
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         This error (16 occurrences) occurs when referencing functions or structs that don't
         exist in imported modules—often due to incorrect Sui framework API knowledge.
         SolMover encounters this only twice versus 6 times for GPT-5.2-Pro, demonstrating
         superior understanding of the Sui framework's module structure and available APIs.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(
-        Paragraph("<b>Framework Knowledge Gap: E03002 - Unbound module</b>", body_style)
+    yield (
+        _para("<b>Framework Knowledge Gap: E03002 - Unbound module</b>", BODY_STYLE)
     )
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         The second most common error (13 occurrences) reveals struggles with Sui's module
         import system. Models attempt to import modules that don't exist or use incorrect
         import paths. This highlights a challenge in keeping current with Sui's evolving
         framework structure—even state-of-the-art models need updated training data.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             "<b>Move-Specific Challenge: E05001 - Ability constraint not satisfied</b>",
-            body_style,
+            BODY_STYLE,
         )
     )
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         Move's ability system (key, store, copy, drop) has no Solidity equivalent, making
         this a uniquely challenging error (14 occurrences). Types must declare specific
         abilities to be used in certain contexts. SolMover shows strong performance with
         only 1 occurrence, while other models struggle more frequently with these constraints.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(PageBreak())
+    yield PageBreak()
 
     # 6. Why These Results Matter
-    story.append(Paragraph("6. Why These Results Matter", heading1_style))
+    yield _para("6. Why These Results Matter", HEADING1_STYLE)
 
-    story.append(
-        Paragraph("<b>For Any Specialized Language Migration</b>", heading2_style)
+    yield (
+        _para("<b>For Any Specialized Language Migration</b>", HEADING2_STYLE)
     )
 
     general_benefits = """
@@ -823,10 +884,10 @@ def create_benchmark_article():
         <b>Universal Pattern:</b> The common thread is specialized domains with high switching costs,
         where automated translation can unlock developer productivity across millions of engineers globally.
     """
-    story.append(Paragraph(general_benefits, body_style))
+    yield _para(general_benefits, BODY_STYLE)
 
-    story.append(
-        Paragraph("<b>For Blockchain Developers (Pilot Case Study)</b>", heading2_style)
+    yield (
+        _para("<b>For Blockchain Developers (Pilot Case Study)</b>", HEADING2_STYLE)
     )
 
     dev_benefits = """
@@ -840,9 +901,9 @@ def create_benchmark_article():
         <b>Iterative Learning Support:</b> The ability to fix errors through 7 iteration cycles 
         mirrors the real debugging process developers will use in practice.
     """
-    story.append(Paragraph(dev_benefits, body_style))
+    yield _para(dev_benefits, BODY_STYLE)
 
-    story.append(Paragraph("<b>For Ecosystem Growth</b>", heading2_style))
+    yield _para("<b>For Ecosystem Growth</b>", HEADING2_STYLE)
 
     ecosystem_benefits = """
         <b>Developer Migration:</b> Lower barriers to entry attract more developers 
@@ -854,9 +915,9 @@ def create_benchmark_article():
         <b>Educational Infrastructure:</b> Since many example contracts used in this benchmark are validated against 100+ students, this benchmark 
         proves that AI-assisted learning can scale developer onboarding efforts, reducing onboarding times from weeks to hours.
     """
-    story.append(Paragraph(ecosystem_benefits, body_style))
+    yield _para(ecosystem_benefits, BODY_STYLE)
 
-    story.append(Paragraph("<b>For Investors & Stakeholders</b>", heading2_style))
+    yield _para("<b>For Investors & Stakeholders</b>", HEADING2_STYLE)
 
     investor_benefits = """
         <b>Market Validation:</b> 28.3 percentage point advantage over Claude (p < 0.001) 
@@ -874,17 +935,17 @@ def create_benchmark_article():
         <b>Statistical Rigor:</b> p-values, confidence intervals, and 88-test sample size 
         provide investment-grade validation.
     """
-    story.append(Paragraph(investor_benefits, body_style))
+    yield _para(investor_benefits, BODY_STYLE)
 
-    story.append(Paragraph("<b>Limitations & Future Work</b>", heading2_style))
-    story.append(
-        Paragraph(
+    yield _para("<b>Limitations & Future Work</b>", HEADING2_STYLE)
+    yield (
+        _para(
             """
         This benchmark focuses on educational examples (beginner to intermediate). Performance 
         on complex DeFi protocols (Uniswap-equivalent, lending protocols) are currently under benchmarking. These will be
         added in our next benchmark. The next benchmark will include the following additions:
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
@@ -895,60 +956,60 @@ def create_benchmark_article():
         • Addition of tests on multi-contract systems and complex state management<br/>
         • Evaluation of maintenance burden (how easy is translated code to modify?)
     """
-    story.append(Paragraph(future_points, body_style))
+    yield _para(future_points, BODY_STYLE)
 
-    story.append(PageBreak())
+    yield PageBreak()
 
     # 7. Implications
-    story.append(
-        Paragraph("7. Implications for AI-Assisted Development", heading1_style)
+    yield (
+        _para("7. Implications for AI-Assisted Development", HEADING1_STYLE)
     )
 
-    story.append(
-        Paragraph("<b>Specialized Models vs General-Purpose LLMs</b>", heading2_style)
+    yield (
+        _para("<b>Specialized Models vs General-Purpose LLMs</b>", HEADING2_STYLE)
     )
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         This benchmark demonstrates that task-specific models can significantly outperform 
         general-purpose LLMs on specialized domains. Claude 4.5 Sonnet, despite being one 
         of the most capable general-purpose models, achieves only 42.0% test pass rate compared 
         to SolMover's 69.3%.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(Paragraph("<br/>", body_style))
+    yield PARAGRAPH_GAP
 
 
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         <b>Key Insight:</b> For niche technical tasks like blockchain language translation,
         domain expertise encoded in specialized models provides measurable advantages that
         justify the development cost of custom solutions.
     """,
-            highlight_style,
+            HIGHLIGHT_STYLE,
         )
     )
 
-    story.append(Paragraph("<br/>", body_style))
+    yield PARAGRAPH_GAP
 
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             "<b>Beyond Blockchain: Universal Translation Architecture</b>",
-            heading2_style,
+            HEADING2_STYLE,
         )
     )
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         While this pilot demonstrates Solidity→Move translation, the architecture and methodology
         generalize to any source-to-source translation task. The insights and infrastructure developed
         here transfer directly to other language pairs and domains.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
@@ -972,13 +1033,13 @@ def create_benchmark_article():
         The framework is designed to be language-agnostic: swap in new compilers, test suites, and error
         taxonomies while preserving the core evaluation logic.
     """
-    story.append(Paragraph(transferable_components, body_style))
+    yield _para(transferable_components, BODY_STYLE)
 
-    story.append(
-        Paragraph("<b>The Importance of Iterative Refinement</b>", heading2_style)
+    yield (
+        _para("<b>The Importance of Iterative Refinement</b>", HEADING2_STYLE)
     )
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         Real-world development isn't one-shot code generation—it's iterative debugging. 
         This benchmark's 7-iteration refinement process (5 compilation fixes + 2 test fixes) 
@@ -987,21 +1048,21 @@ def create_benchmark_article():
         perfect first-shot code but fail catastrophically when they don't. During our benchmarks, this
         is exactly the behavior we encountered when testing the aforementioned general-purpose LLMs.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(
-        Paragraph("<b>Onboarding via AI: Beyond Code Generation</b>", heading2_style)
+    yield (
+        _para("<b>Onboarding via AI: Beyond Code Generation</b>", HEADING2_STYLE)
     )
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         This work extends AI-assisted development into education. The benchmark's validation 
         against examples used by 100+ students proves that AI-generated code can serve as learning material, 
         not just production artifacts, greatly improving oboarding velocity of newcomers to new ecosystem. This opens new possibilities:
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
@@ -1011,15 +1072,15 @@ def create_benchmark_article():
         • Scaling expert instruction beyond human availability<br/>
         • Democratizing access to emerging blockchain platforms and more
     """
-    story.append(Paragraph(edu_possibilities, body_style))
+    yield _para(edu_possibilities, BODY_STYLE)
 
-    story.append(PageBreak())
+    yield PageBreak()
 
     # 8. Conclusion
-    story.append(Paragraph("8. Conclusion", heading1_style))
+    yield _para("8. Conclusion", HEADING1_STYLE)
 
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         This benchmark establishes a rigorous methodology for evaluating smart contract 
         translation models, going beyond simple compilation success to measure functional 
@@ -1027,11 +1088,11 @@ def create_benchmark_article():
         <b>SolMover achieves production-viable performance (73.9/100)</b> on 
         Solidity-to-Move translation, significantly outperforming general-purpose models.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(Paragraph("<b>Key Takeaways</b>", heading2_style))
+    yield _para("<b>Key Takeaways</b>", HEADING2_STYLE)
 
     takeaways = """
         1. <b>Statistical Significance:</b> SolMover's 27.3 percentage point advantage over 
@@ -1049,12 +1110,12 @@ def create_benchmark_article():
         5. <b>Market Opportunity:</b> 4-5 months time savings per developer × the possibility of fitting the model to any language pair
         = massive addressable market for developer tools, especially useful for ecosystems with domain specific languages.
     """
-    story.append(Paragraph(takeaways, body_style))
+    yield _para(takeaways, BODY_STYLE)
 
-    story.append(Spacer(1, 0.3 * inch))
+    yield Spacer(1, 0.3 * inch)
 
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         While this benchmark uses blockchain as its proving ground, the implications extend to any
         specialized language migration challenge. As software development fragments into domain-specific
@@ -1062,12 +1123,12 @@ def create_benchmark_article():
         mobile platforms, or real-time systems—the need for reliable, validated translation infrastructure
         becomes universal.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(
-        Paragraph(
+    yield (
+        _para(
             """
         This benchmark provides a <b>reusable methodology</b> for evaluating code translation models
         across any language pair. The combination of iterative refinement, comprehensive testing, and
@@ -1077,20 +1138,49 @@ def create_benchmark_article():
         where millions of developers face similar migration challenges—from MATLAB→Python in scientific
         computing to COBOL→Java in enterprise systems.
     """,
-            body_style,
+            BODY_STYLE,
         )
     )
 
-    story.append(Spacer(1, 0.3 * inch))
+    yield Spacer(1, 0.3 * inch)
 
     conclusion_box = """
         <b>For further information or to access the complete benchmark dataset, 
         contact the research team or visit the project repository.</b>
     """
-    story.append(Paragraph(conclusion_box, highlight_style))
+    yield _para(conclusion_box, HIGHLIGHT_STYLE)
+
+
+
+def render_pdf(flowables, pdf_path):
+    """Lay out ``flowables`` and write the PDF to ``pdf_path``."""
+    # Rendered into memory, written to disk in a single call
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        topMargin=0.75 * inch,
+        bottomMargin=0.75 * inch,
+        leftMargin=0.75 * inch,
+        rightMargin=0.75 * inch,
+    )
+    # Write streams as raw compressed binary rather than ASCII85 text, which
+    # is ~25% larger and dominated build time when encoding the chart image
+    use_a85 = rl_config.useA85
+    rl_config.useA85 = 0
+    try:
+        # doc.build consumes its argument as a list, popping flowables as it goes
+        doc.build(list(flowables))
+    finally:
+        rl_config.useA85 = use_a85
+    with open(pdf_path, "wb") as f:
+        f.write(buffer.getvalue())
+
 
-    # Build PDF
-    doc.build(story)
+def create_benchmark_article():
+    """Create comprehensive PDF article"""
+    pdf_path = "./Shinso_Solmover_Benchmark_2026_01_06.pdf"
+    render_pdf(iter_story(), pdf_path)
     print(f"✓ PDF article created: {pdf_path}")
     return pdf_path
 
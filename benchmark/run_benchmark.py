@@ -7,17 +7,26 @@ Compares SolMover vs Gemini-2.5 vs Qwen3-Coder outputs
 import os
 import subprocess
 import json
+import hashlib
 import re
 from datetime import datetime
 from pathlib import Path
 import platform
 import sys
+import asyncio
+import threading
+import argparse
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import math
+from types import MappingProxyType
 import numpy as np
-from scipy import stats
-from scipy.stats import chi2_contingency, fisher_exact
-import matplotlib.pyplot as plt
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
 
 # Configuration
 BENCHMARK_DIR = Path("/Users/vargaelod/shinso/model/benchmark")
@@ -38,9 +47,11 @@ MODELS = {
     "gpt-5.2-pro": "output_gpt-5.2-pro",
     "claude-4.5-sonnet": "output_claude-4.5-sonnet"
 }
+MODEL_NAMES = tuple(MODELS)
 
-# Expected test counts (from the reference implementation)
-EXPECTED_TESTS = {
+# Expected test counts (from the reference implementation), read-only since
+# the concurrently running contract tests all share it
+EXPECTED_TESTS = MappingProxyType({
     "0_hello_world": 11,
     "1_tipjar": 12,
     "2_guestbook": 12,
@@ -48,7 +59,11 @@ EXPECTED_TESTS = {
     "4_simple_coin": 12,
     "5_counter": 14,
     "6_weather_oracle": 13
-}
+})
+
+# The article embeds the chart 6.5in wide; it is rendered to that width at 300 DPI
+CHART_EMBED_WIDTH_IN = 6.5
+CHART_EMBED_DPI = 300
 
 # Model configuration metadata
 MODELS_CONFIG = {
@@ -96,6 +111,19 @@ MODELS_CONFIG = {
     }
 }
 
+# `sui move test` output patterns
+# Matched against raw output bytes, so lines never need decoding
+TEST_RESULT_RE = re.compile(rb"Test result: OK\. Total tests: (\d+); passed: (\d+); failed: (\d+)")
+ERROR_CODE_RE = re.compile(rb"error\[E\d+\]")
+MAX_ERROR_CODES = 5  # distinct error codes kept per failed contract
+SUI_TEST_TIMEOUT = 60  # seconds
+# Longest output line read from `sui move test`; asyncio's default is 64 KiB
+SUI_OUTPUT_LINE_LIMIT = 16 * 1024 * 1024  # bytes
+
+# Dependencies are fetched once by warm_dependency_cache(); the per-contract
+# test runs then reuse them instead of re-resolving the git dependencies
+SUI_TEST_COMMAND = ["sui", "move", "test", "--skip-fetch-latest-git-deps"]
+
 # Common Move error descriptions
 ERROR_DESCRIPTIONS = {
     "error[E01002]": "Unexpected token",
@@ -128,8 +156,88 @@ ERROR_DESCRIPTIONS = {
 }
 
 
-def test_contract(model_name, contract_name):
-    """Test a single contract and return results"""
+def dumps_json(obj, indent=False):
+    """Serialize ``obj`` to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+@lru_cache(maxsize=1)
+def sui_cli_version():
+    """Version string of the installed sui CLI, queried once per process
+
+    Empty when the CLI cannot be run, so a missing `sui` is reported per
+    contract by test_contract rather than aborting the whole run.
+    """
+    try:
+        return subprocess.run(["sui", "--version"], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ""
+
+
+def contract_source_key(output_dir, sui_version):
+    """Hash a contract package's sources, manifest and the sui toolchain version"""
+    digest = hashlib.blake2b(sui_version.encode())
+    sources = [p for p in output_dir.rglob("*.move") if "build" not in p.relative_to(output_dir).parts]
+    for path in sorted(sources) + [output_dir / "Move.toml"]:
+        digest.update(str(path.relative_to(output_dir)).encode())
+        if path.is_file():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def pair_cache_key(model_name, contract_name, sui_version):
+    """Result cache key of a model x contract pair, hashed once per process"""
+    output_dir = BENCHMARK_DIR / MODELS[model_name] / contract_name
+    return f"{model_name}/{contract_name}/{contract_source_key(output_dir, sui_version)}"
+
+
+def load_result_cache(cache_file):
+    """Load cached test results, keyed by contract source hash"""
+    try:
+        return json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_result_cache(cache_file, cache):
+    """Persist cached test results"""
+    cache_file.write_bytes(dumps_json(cache, indent=True))
+
+
+async def scan_test_output(process):
+    """Scan `sui move test` output line by line as it is produced
+
+    Returns the exit code, the test result match, the warning count and the
+    first MAX_ERROR_CODES distinct error codes in first-seen order. The output
+    is still read to the end so the child never blocks on a full pipe.
+    """
+    test_match = None
+    warnings = 0
+    error_codes = {}  # insertion-ordered set of error codes
+    async for line in process.stdout:
+        warnings += line.count(b"warning")
+        if test_match is None:
+            test_match = TEST_RESULT_RE.search(line)
+        if len(error_codes) < MAX_ERROR_CODES:
+            for match in ERROR_CODE_RE.finditer(line):
+                error_codes[match.group()] = None
+                if len(error_codes) == MAX_ERROR_CODES:
+                    break
+    returncode = await process.wait()
+    return returncode, test_match, warnings, [code.decode() for code in error_codes]
+
+
+async def test_contract(model_name, contract_name, cache=None, sui_version=""):
+    """Test a single contract and return results
+
+    When a ``cache`` dict is given, results are looked up and stored under a
+    hash of the contract's sources and ``sui_version``, so unchanged packages
+    are not rebuilt.
+    """
     output_dir = BENCHMARK_DIR / MODELS[model_name] / contract_name
 
     result = {
@@ -151,31 +259,51 @@ def test_contract(model_name, contract_name):
         result["errors"].append(f"Directory not found: {output_dir}")
         return result
 
+    # Without a manifest `sui move test` can only fail, after starting up
+    if not (output_dir / "Move.toml").is_file():
+        result["errors"].append(f"Move.toml not found: {output_dir}")
+        return result
+
+    cache_key = None
+    if cache is not None:
+        cache_key = pair_cache_key(model_name, contract_name, sui_version)
+        if cache_key in cache:
+            return dict(cache[cache_key])
+
     # Run sui move test
     try:
-        process = subprocess.run(
-            ["sui", "move", "test"],
+        process = await asyncio.create_subprocess_exec(
+            *SUI_TEST_COMMAND,
             cwd=output_dir,
-            capture_output=True,
-            text=True,
-            timeout=60
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            limit=SUI_OUTPUT_LINE_LIMIT
         )
-
-        output = process.stdout + process.stderr
+        try:
+            returncode, test_match, warnings, error_codes = await asyncio.wait_for(
+                scan_test_output(process), SUI_TEST_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(SUI_TEST_COMMAND, SUI_TEST_TIMEOUT)
+        finally:
+            # On a timeout or any error while reading its output, the child
+            # would otherwise stay blocked on a pipe nobody reads
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
 
         # Check if compiled successfully
-        if process.returncode == 0:
+        if returncode == 0:
             result["compiles"] = True
             result["compile_score"] = 40
 
             # Parse test results
-            test_match = re.search(r"Test result: OK\. Total tests: (\d+); passed: (\d+); failed: (\d+)", output)
             if test_match:
                 result["tests_total"] = int(test_match.group(1))
                 result["tests_passed"] = int(test_match.group(2))
 
             # Count warnings
-            result["warnings"] = output.count("warning")
+            result["warnings"] = warnings
 
         else:
             # Compilation failed
@@ -183,9 +311,7 @@ def test_contract(model_name, contract_name):
             result["compile_score"] = 0
 
             # Extract error types
-            if "error[E" in output:
-                error_codes = re.findall(r"error\[E\d+\]", output)
-                result["errors"] = list(set(error_codes))[:5]  # Top 5 unique errors
+            result["errors"] = error_codes  # First MAX_ERROR_CODES unique errors
 
         # Calculate test score (out of 50)
         if result["tests_expected"] > 0:
@@ -205,24 +331,36 @@ def test_contract(model_name, contract_name):
             2
         )
 
+        # Only completed runs are cached; timeouts and errors are retried
+        if cache_key is not None:
+            cache[cache_key] = dict(result)
+
     except subprocess.TimeoutExpired:
-        result["errors"].append("Test timeout (>60s)")
+        result["errors"].append(f"Test timeout (>{SUI_TEST_TIMEOUT}s)")
     except Exception as e:
         result["errors"].append(f"Error: {str(e)}")
 
     return result
 
+# Two-sided 95% normal quantile, stats.norm.ppf(0.975)
+_Z95 = 1.959963984540054
+
+
 def wilson_score_interval(successes, trials, confidence=0.95):
     """Calculate Wilson score confidence interval for proportion"""
     if trials == 0:
         return 0, 0, 0
     
     p = successes / trials
-    z = stats.norm.ppf((1 + confidence) / 2)
+    if confidence == 0.95:
+        z = _Z95
+    else:
+        from scipy import stats
+        z = stats.norm.ppf((1 + confidence) / 2)
     
     denominator = 1 + z**2 / trials
     center = (p + z**2 / (2 * trials)) / denominator
-    margin = z * np.sqrt((p * (1 - p) / trials + z**2 / (4 * trials**2))) / denominator
+    margin = z * math.sqrt((p * (1 - p) / trials + z**2 / (4 * trials**2))) / denominator
     
     lower = max(0, center - margin)
     upper = min(1, center + margin)
@@ -230,16 +368,20 @@ def wilson_score_interval(successes, trials, confidence=0.95):
     return p, lower, upper
 
 
-def perform_statistical_analysis(results):
+def perform_statistical_analysis(results, model_stats=None):
     """Perform comprehensive statistical analysis on benchmark results"""
-    models = list(MODELS.keys())
+    # Imported here so scipy.stats loads after the tests have run, not at startup
+    from scipy.stats import chi2_contingency, fisher_exact
+
+    models = MODEL_NAMES
+    if model_stats is None:
+        model_stats = summarize_models(results)
     
     # Collect test pass data
     model_data = {}
     for model in models:
-        model_results = [r for r in results if r["model"] == model]
-        passed = sum(r["tests_passed"] for r in model_results)
-        total = sum(r["tests_expected"] for r in model_results)
+        passed = model_stats[model]["total_passed"]
+        total = model_stats[model]["total_expected"]
         model_data[model] = {
             "passed": passed,
             "failed": total - passed,
@@ -255,22 +397,19 @@ def perform_statistical_analysis(results):
     
     chi2, p_value, dof, expected = chi2_contingency(contingency_table)
     
-    # Pairwise comparisons (Fisher's exact test)
+    # Pairwise comparisons (Fisher's exact test); each pair's 2x2 table is
+    # the two models' rows of the contingency table above
     pairwise = []
-    for i, model1 in enumerate(models):
-        for model2 in models[i+1:]:
-            table = np.array([
-                [model_data[model1]["passed"], model_data[model1]["failed"]],
-                [model_data[model2]["passed"], model_data[model2]["failed"]]
-            ])
-            _, p = fisher_exact(table)
-            diff = (model_data[model1]["rate"] - model_data[model2]["rate"]) * 100
-            pairwise.append({
-                "model1": model1,
-                "model2": model2,
-                "diff": diff,
-                "p_value": p
-            })
+    for i, j in zip(*np.triu_indices(len(models), 1)):
+        model1, model2 = models[i], models[j]
+        _, p = fisher_exact(contingency_table[[i, j]])
+        diff = (model_data[model1]["rate"] - model_data[model2]["rate"]) * 100
+        pairwise.append({
+            "model1": model1,
+            "model2": model2,
+            "diff": diff,
+            "p_value": p
+        })
     
     # Confidence intervals
     confidence_intervals = {}
@@ -300,62 +439,98 @@ def perform_statistical_analysis(results):
 def analyze_errors(results):
     """Analyze error patterns across models and contracts"""
     error_by_model = {}
-    error_by_type = {}
+    models_by_error = defaultdict(Counter)
     
     for result in results:
         model = result["model"]
-        if model not in error_by_model:
-            error_by_model[model] = {}
-        
+        model_errors = error_by_model.setdefault(model, Counter())
         for error in result["errors"]:
-            # Count by model
-            if error not in error_by_model[model]:
-                error_by_model[model][error] = 0
-            error_by_model[model][error] += 1
-            
-            # Count by type
-            if error not in error_by_type:
-                error_by_type[error] = {
-                    "total": 0,
-                    "models": {},
-                    "description": ERROR_DESCRIPTIONS.get(error, "Unknown error")
-                }
-            error_by_type[error]["total"] += 1
-            if model not in error_by_type[error]["models"]:
-                error_by_type[error]["models"][model] = 0
-            error_by_type[error]["models"][model] += 1
-    
-    # Sort errors by frequency
-    sorted_errors = sorted(error_by_type.items(), key=lambda x: x[1]["total"], reverse=True)
+            model_errors[error] += 1
+            models_by_error[error][model] += 1
+    
+    # Sort errors by frequency (ties keep first-seen order)
+    totals = Counter({error: sum(models.values()) for error, models in models_by_error.items()})
+    error_by_type = {
+        error: {
+            "total": total,
+            "models": dict(models_by_error[error]),
+            "description": ERROR_DESCRIPTIONS.get(error, "Unknown error")
+        }
+        for error, total in totals.most_common(10)  # Top 10 errors
+    }
     
     return {
-        "by_model": error_by_model,
-        "by_type": dict(sorted_errors[:10])  # Top 10 errors
+        "by_model": {model: dict(errors) for model, errors in error_by_model.items()},
+        "by_type": error_by_type
     }
 
 
-def generate_charts(results, stats_analysis, error_analysis, output_dir):
-    """Generate comprehensive visualization charts (2x3 grid)"""
-    
-    # Calculate statistics
+def summarize_models(results):
+    """Aggregate per-model averages and test totals in a single pass over results"""
+    totals = {
+        model: {"count": 0, "score": 0, "compiles": 0, "compile": 0, "test": 0,
+                "quality": 0, "passed": 0, "expected": 0}
+        for model in MODEL_NAMES
+    }
+    for r in results:
+        t = totals[r["model"]]
+        t["count"] += 1
+        t["score"] += r["total_score"]
+        t["compiles"] += r["compiles"]
+        t["compile"] += r["compile_score"]
+        t["test"] += r["test_score"]
+        t["quality"] += r["quality_score"]
+        t["passed"] += r["tests_passed"]
+        t["expected"] += r["tests_expected"]
+
     model_stats = {}
-    for model in MODELS.keys():
-        model_results = [r for r in results if r["model"] == model]
+    for model, t in totals.items():
+        n = t["count"]
         model_stats[model] = {
-            "avg_score": sum(r["total_score"] for r in model_results) / len(model_results),
-            "compile_rate": sum(1 for r in model_results if r["compiles"]) / len(model_results) * 100,
-            "avg_compile": sum(r["compile_score"] for r in model_results) / len(model_results),
-            "avg_test": sum(r["test_score"] for r in model_results) / len(model_results),
-            "avg_quality": sum(r["quality_score"] for r in model_results) / len(model_results),
-            "total_passed": sum(r["tests_passed"] for r in model_results),
-            "total_expected": sum(r["tests_expected"] for r in model_results)
+            "avg_score": t["score"] / n,
+            "compile_rate": t["compiles"] / n * 100,
+            "avg_compile": t["compile"] / n,
+            "avg_test": t["test"] / n,
+            "avg_quality": t["quality"] / n,
+            "total_passed": t["passed"],
+            "total_expected": t["expected"],
+            "pass_rate": (t["passed"] / t["expected"] * 100) if t["expected"] > 0 else 0
         }
+    return model_stats
+
+
+def warm_chart_backend():
+    """Import matplotlib and load its font cache ahead of generate_charts
+
+    Run in a background thread while the tests execute, so the import and the
+    first font lookup (a full font directory scan when the cache is cold) do
+    not add to the time spent after the last test finishes.
+    """
+    from matplotlib import font_manager
+    font_manager.findfont(font_manager.FontProperties(weight='bold'))
+
+
+def generate_charts(results, stats_analysis, error_analysis, output_dir, model_stats=None):
+    """Generate comprehensive visualization charts (2x3 grid)"""
+    # Imported here so runs without charts skip matplotlib's startup cost
+    # Figure is used without pyplot, so no GUI backend or global figure
+    # registry is involved; the PNG is rendered by the Agg canvas directly
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
     
-    # Create 2x3 subplot layout
-    fig = plt.figure(figsize=(20, 12))
-    gs = fig.add_gridspec(2, 3, hspace=0.3, wspace=0.3)
+    # Calculate statistics
+    if model_stats is None:
+        model_stats = summarize_models(results)
     
-    models = list(MODELS.keys())
+    # Create 2x3 subplot layout
+    # The 20x12 figure has the same aspect ratio as the article's 6.5x3.9in
+    # slot; fixed margins replace the extra layout pass of bbox_inches='tight'
+    fig = Figure(figsize=(20, 12))
+    FigureCanvasAgg(fig)
+    gs = fig.add_gridspec(2, 3, hspace=0.3, wspace=0.3,
+                          left=0.05, right=0.97, bottom=0.1, top=0.93)
+    
+    models = MODEL_NAMES
     colors = ['#4CAF50', '#2196F3', '#FF9800', '#9C27B0', '#6A27B0', '#1A27B0']
     
     # Chart 1: Overall Performance
@@ -370,16 +545,12 @@ def generate_charts(results, stats_analysis, error_analysis, output_dir):
     ax1.legend(fontsize=9)
     ax1.tick_params(axis='x', rotation=45)
     
-    for bar in bars1:
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.1f}', ha='center', va='bottom', fontweight='bold', fontsize=10)
+    ax1.bar_label(bars1, fmt='{:.1f}', fontweight='bold', fontsize=10)
     
     # Chart 2: Compilation vs Test Pass Rate
     ax2 = fig.add_subplot(gs[0, 1])
     compile_rates = [model_stats[m]["compile_rate"] for m in models]
-    test_pass_rates = [(model_stats[m]["total_passed"] / model_stats[m]["total_expected"] * 100)
-                       for m in models]
+    test_pass_rates = [model_stats[m]["pass_rate"] for m in models]
     
     x = np.arange(len(models))
     width = 0.35
@@ -396,10 +567,7 @@ def generate_charts(results, stats_analysis, error_analysis, output_dir):
     ax2.set_ylim(0, 110)
     
     for bars in [bars2a, bars2b]:
-        for bar in bars:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}%', ha='center', va='bottom', fontsize=8)
+        ax2.bar_label(bars, fmt='{:.1f}%', fontsize=8)
     
     # Chart 3: Test Pass Rate with Confidence Intervals
     ax3 = fig.add_subplot(gs[0, 2])
@@ -416,10 +584,7 @@ def generate_charts(results, stats_analysis, error_analysis, output_dir):
     ax3.set_ylim(0, 100)
     ax3.tick_params(axis='x', rotation=45)
     
-    for i, bar in enumerate(bars3):
-        height = bar.get_height()
-        ax3.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.1f}%', ha='center', va='bottom', fontweight='bold', fontsize=9)
+    ax3.bar_label(bars3, fmt='{:.1f}%', fontweight='bold', fontsize=9)
     
     # Chart 4: Score Breakdown
     ax4 = fig.add_subplot(gs[1, 0])
@@ -448,16 +613,14 @@ def generate_charts(results, stats_analysis, error_analysis, output_dir):
     
     # Prepare error matrix
     top_errors = list(error_analysis["by_type"].keys())[:5]  # Top 5 errors
-    error_matrix = []
-    for model in models:
-        row = []
-        for error in top_errors:
-            count = error_analysis["by_type"][error]["models"].get(model, 0)
-            row.append(count)
-        error_matrix.append(row)
+    error_matrix = np.zeros((len(top_errors), len(models)), dtype=int)
+    for i, error in enumerate(top_errors):
+        error_models = error_analysis["by_type"][error]["models"]
+        for j, model in enumerate(models):
+            error_matrix[i, j] = error_models.get(model, 0)
     
-    error_matrix = np.array(error_matrix).T
-    im = ax5.imshow(error_matrix, cmap='YlOrRd', aspect='auto')
+    # One cell per count, so no resampling filter is needed
+    im = ax5.imshow(error_matrix, cmap='YlOrRd', aspect='auto', interpolation='nearest')
     
     ax5.set_xticks(np.arange(len(models)))
     ax5.set_yticks(np.arange(len(top_errors)))
@@ -472,7 +635,7 @@ def generate_charts(results, stats_analysis, error_analysis, output_dir):
                            ha="center", va="center", color="black" if error_matrix[i, j] < 5 else "white",
                            fontweight='bold', fontsize=9)
     
-    plt.colorbar(im, ax=ax5, label='Occurrences')
+    fig.colorbar(im, ax=ax5, label='Occurrences')
     
     # Chart 6: Testing Rigor Comparison
     ax6 = fig.add_subplot(gs[1, 2])
@@ -488,82 +651,74 @@ def generate_charts(results, stats_analysis, error_analysis, output_dir):
     ax6.axhline(y=1, color='red', linestyle='--', linewidth=1.5, alpha=0.5, label='Industry standard')
     ax6.legend(fontsize=9)
     
-    for bar in bars6:
-        height = bar.get_height()
-        ax6.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.1f}×', ha='center', va='bottom', fontweight='bold', fontsize=11)
+    ax6.bar_label(bars6, fmt='{:.1f}×', fontweight='bold', fontsize=11)
     
     fig.suptitle('Comprehensive Benchmark Analysis', fontsize=18, fontweight='bold', y=0.995)
     
     # Save chart
     chart_path = output_dir / "benchmark_charts.png"
-    plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    print(f"✓ Charts saved to: {chart_path}")
+    # Raster for the markdown report and the PDF article, at the DPI that
+    # makes it exactly the embedded width; vector copy for lossless reuse
+    dpi = CHART_EMBED_DPI * CHART_EMBED_WIDTH_IN / fig.get_figwidth()
+    fig.savefig(chart_path, dpi=dpi, pil_kwargs={"optimize": True, "compress_level": 9})
+    fig.savefig(chart_path.with_suffix(".svg"))
     
     return chart_path
 
-def generate_markdown_table(results, stats_analysis, error_analysis):
+def generate_markdown_table(results, stats_analysis, error_analysis, model_stats=None, run_ts=None):
     """Generate enhanced markdown report with statistical analysis"""
+    if model_stats is None:
+        model_stats = summarize_models(results)
+    if run_ts is None:
+        run_ts = datetime.now()
     
-    markdown = "# Sui Move Translation Benchmark Results\n\n"
-    markdown += f"**Benchmark Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    markdown += f"**Total Test Cases:** 88 comprehensive unit tests across 7 contracts\n\n"
+    parts = ["# Sui Move Translation Benchmark Results\n\n"]
+    parts.append(f"**Benchmark Date:** {run_ts:%Y-%m-%d %H:%M:%S}\n\n")
+    parts.append(f"**Total Test Cases:** 88 comprehensive unit tests across 7 contracts\n\n")
     
-    markdown += "## Visual Comparison\n\n"
-    markdown += "![Benchmark Charts](benchmark_charts.png)\n\n"
+    parts.append("## Visual Comparison\n\n")
+    parts.append("![Benchmark Charts](benchmark_charts.png)\n\n")
     
-    markdown += "## Scoring System\n\n"
-    markdown += "- **Compilation (40 points):** Code compiles without errors\n"
-    markdown += "- **Test Pass Rate (50 points):** (Tests Passed / Expected Tests) × 50\n"
-    markdown += "- **Code Quality (10 points):** Based on warning count\n"
-    markdown += "- **Total Score:** Sum of all categories (max 100 per contract)\n\n"
+    parts.append("## Scoring System\n\n")
+    parts.append("- **Compilation (40 points):** Code compiles without errors\n")
+    parts.append("- **Test Pass Rate (50 points):** (Tests Passed / Expected Tests) × 50\n")
+    parts.append("- **Code Quality (10 points):** Based on warning count\n")
+    parts.append("- **Total Score:** Sum of all categories (max 100 per contract)\n\n")
     
     # Detailed results table
-    markdown += "## Detailed Results by Contract\n\n"
-    markdown += "| Contract | Model | Compiles | Tests Passed | Expected | Pass Rate | Warnings | Score |\n"
-    markdown += "|----------|-------|----------|--------------|----------|-----------|----------|-------|\n"
+    parts.append("## Detailed Results by Contract\n\n")
+    parts.append("| Contract | Model | Compiles | Tests Passed | Expected | Pass Rate | Warnings | Score |\n")
+    parts.append("|----------|-------|----------|--------------|----------|-----------|----------|-------|\n")
     
+    by_key = {(r["contract"], r["model"]): r for r in results}
     for contract in CONTRACTS:
-        for model in MODELS.keys():
-            result = next((r for r in results if r["contract"] == contract and r["model"] == model), None)
+        for model in MODEL_NAMES:
+            result = by_key.get((contract, model))
             if result:
                 compiles = "✅" if result["compiles"] else "❌"
                 percentage = f"{(result['tests_passed']/result['tests_expected']*100):.1f}%" if result['tests_expected'] > 0 else "N/A"
                 score = f"{result['total_score']:.1f}/100"
-                markdown += f"| {contract} | {model} | {compiles} | {result['tests_passed']} | {result['tests_expected']} | {percentage} | {result['warnings']} | {score} |\n"
+                parts.append(f"| {contract} | {model} | {compiles} | {result['tests_passed']} | {result['tests_expected']} | {percentage} | {result['warnings']} | {score} |\n")
     
     # Summary statistics
-    markdown += "\n## Summary Statistics\n\n"
-    markdown += "| Model | Avg Score | Compilation Rate | Avg Test Pass Rate | Total Tests Passed |\n"
-    markdown += "|-------|-----------|------------------|--------------------|--------------------|""\n"
-    
-    for model in MODELS.keys():
-        model_results = [r for r in results if r["model"] == model]
-        avg_score = sum(r["total_score"] for r in model_results) / len(model_results)
-        compile_rate = sum(1 for r in model_results if r["compiles"]) / len(model_results) * 100
-        total_passed = sum(r["tests_passed"] for r in model_results)
-        total_expected = sum(r["tests_expected"] for r in model_results)
-        avg_pass_rate = (total_passed / total_expected * 100) if total_expected > 0 else 0
-        
-        markdown += f"| {model} | {avg_score:.1f}/100 | {compile_rate:.1f}% | {avg_pass_rate:.1f}% | {total_passed}/{total_expected} |\n"
+    parts.append("\n## Summary Statistics\n\n")
+    parts.append("| Model | Avg Score | Compilation Rate | Avg Test Pass Rate | Total Tests Passed |\n")
+    parts.append("|-------|-----------|------------------|--------------------|--------------------|""\n")
+    
+    for model, ms in model_stats.items():
+        parts.append(f"| {model} | {ms['avg_score']:.1f}/100 | {ms['compile_rate']:.1f}% | {ms['pass_rate']:.1f}% | {ms['total_passed']}/{ms['total_expected']} |\n")
     
     # Score breakdown
-    markdown += "\n## Score Breakdown by Category\n\n"
-    markdown += "| Model | Avg Compilation | Avg Test Score | Avg Quality |\n"
-    markdown += "|-------|-----------------|----------------|-------------|\n"
+    parts.append("\n## Score Breakdown by Category\n\n")
+    parts.append("| Model | Avg Compilation | Avg Test Score | Avg Quality |\n")
+    parts.append("|-------|-----------------|----------------|-------------|\n")
     
-    for model in MODELS.keys():
-        model_results = [r for r in results if r["model"] == model]
-        avg_compile = sum(r["compile_score"] for r in model_results) / len(model_results)
-        avg_test = sum(r["test_score"] for r in model_results) / len(model_results)
-        avg_quality = sum(r["quality_score"] for r in model_results) / len(model_results)
-        markdown += f"| {model} | {avg_compile:.1f}/40 | {avg_test:.1f}/50 | {avg_quality:.1f}/10 |\n"
+    for model, ms in model_stats.items():
+        parts.append(f"| {model} | {ms['avg_compile']:.1f}/40 | {ms['avg_test']:.1f}/50 | {ms['avg_quality']:.1f}/10 |\n")
     
     # Statistical Analysis Section
-    markdown += "\n## Statistical Analysis\n\n"
-    markdown += "### Overall Comparison (Chi-Square Test)\n\n"
+    parts.append("\n## Statistical Analysis\n\n")
+    parts.append("### Overall Comparison (Chi-Square Test)\n\n")
     
     chi2_stat = stats_analysis["chi_square"]["statistic"]
     chi2_p = stats_analysis["chi_square"]["p_value"]
@@ -571,96 +726,199 @@ def generate_markdown_table(results, stats_analysis, error_analysis):
     
     significance = "***" if chi2_p < 0.001 else ("**" if chi2_p < 0.01 else ("*" if chi2_p < 0.05 else "ns"))
     
-    markdown += f"Testing whether test pass rates differ significantly across models (n=88 tests):\n\n"
-    markdown += f"- **χ² statistic:** {chi2_stat:.2f}\n"
-    markdown += f"- **p-value:** {chi2_p:.2e} {significance}\n"
-    markdown += f"- **Degrees of freedom:** {dof}\n\n"
+    parts.append(f"Testing whether test pass rates differ significantly across models (n=88 tests):\n\n")
+    parts.append(f"- **χ² statistic:** {chi2_stat:.2f}\n")
+    parts.append(f"- **p-value:** {chi2_p:.2e} {significance}\n")
+    parts.append(f"- **Degrees of freedom:** {dof}\n\n")
     
     if chi2_p < 0.001:
-        markdown += "**Interpretation:** Highly significant difference in test pass rates across models (p < 0.001).\n\n"
+        parts.append("**Interpretation:** Highly significant difference in test pass rates across models (p < 0.001).\n\n")
     elif chi2_p < 0.05:
-        markdown += "**Interpretation:** Significant difference in test pass rates across models (p < 0.05).\n\n"
+        parts.append("**Interpretation:** Significant difference in test pass rates across models (p < 0.05).\n\n")
     else:
-        markdown += "**Interpretation:** No significant difference detected (p ≥ 0.05).\n\n"
+        parts.append("**Interpretation:** No significant difference detected (p ≥ 0.05).\n\n")
     
     # Pairwise comparisons
-    markdown += "### Pairwise Comparisons (Fisher's Exact Test)\n\n"
-    markdown += "| Comparison | Pass Rate Difference | p-value | Significance |\n"
-    markdown += "|------------|---------------------|---------|-------------|\n"
+    parts.append("### Pairwise Comparisons (Fisher's Exact Test)\n\n")
+    parts.append("| Comparison | Pass Rate Difference | p-value | Significance |\n")
+    parts.append("|------------|---------------------|---------|-------------|\n")
     
     for pair in stats_analysis["pairwise"]:
         sig_marker = "✓ ***" if pair["p_value"] < 0.001 else ("✓ **" if pair["p_value"] < 0.01 else ("✓ *" if pair["p_value"] < 0.05 else "ns"))
-        markdown += f"| {pair['model1']} vs {pair['model2']} | {pair['diff']:+.1f}% | {pair['p_value']:.3f} | {sig_marker} |\n"
+        parts.append(f"| {pair['model1']} vs {pair['model2']} | {pair['diff']:+.1f}% | {pair['p_value']:.3f} | {sig_marker} |\n")
     
-    markdown += "\n*Significance levels: *** p<0.001, ** p<0.01, * p<0.05, ns = not significant*\n\n"
+    parts.append("\n*Significance levels: *** p<0.001, ** p<0.01, * p<0.05, ns = not significant*\n\n")
     
     # Confidence intervals
-    markdown += "### Confidence Intervals (95% Wilson Score)\n\n"
-    markdown += "| Model | Test Pass Rate | 95% Confidence Interval |\n"
-    markdown += "|-------|---------------|------------------------|\n"
+    parts.append("### Confidence Intervals (95% Wilson Score)\n\n")
+    parts.append("| Model | Test Pass Rate | 95% Confidence Interval |\n")
+    parts.append("|-------|---------------|------------------------|\n")
     
     ci_data = stats_analysis["confidence_intervals"]
-    for model in MODELS.keys():
+    for model in MODEL_NAMES:
         rate = ci_data[model]["rate"]
         lower = ci_data[model]["lower"]
         upper = ci_data[model]["upper"]
-        markdown += f"| {model} | {rate:.1f}% | [{lower:.1f}% - {upper:.1f}%] |\n"
+        parts.append(f"| {model} | {rate:.1f}% | [{lower:.1f}% - {upper:.1f}%] |\n")
     
     # Error Analysis Section
-    markdown += "\n## Error Analysis\n\n"
-    markdown += "### Top 5 Most Common Errors\n\n"
+    parts.append("\n## Error Analysis\n\n")
+    parts.append("### Top 5 Most Common Errors\n\n")
     
     for i, (error, data) in enumerate(list(error_analysis["by_type"].items())[:5], 1):
         error_code = error.replace('error[', '').replace(']', '')
-        markdown += f"#### {i}. {error_code}: {data['description']}\n\n"
-        markdown += f"**Total occurrences:** {data['total']}\n\n"
-        markdown += "**Models affected:**\n"
+        parts.append(f"#### {i}. {error_code}: {data['description']}\n\n")
+        parts.append(f"**Total occurrences:** {data['total']}\n\n")
+        parts.append("**Models affected:**\n")
         for model, count in sorted(data["models"].items(), key=lambda x: x[1], reverse=True):
-            markdown += f"- {model}: {count}\n"
-        markdown += "\n"
-    
-    return markdown
+            parts.append(f"- {model}: {count}\n")
+        parts.append("\n")
+    
+    return "".join(parts)
+
+def has_manifest(model, contract):
+    """Whether the model's output for ``contract`` is a buildable Move package"""
+    return (BENCHMARK_DIR / MODELS[model] / contract / "Move.toml").is_file()
+
+
+def untested_pairs(cache, sui_version):
+    """Model x contract pairs with a package manifest and no cached result"""
+    return [
+        (model, contract)
+        for model in MODEL_NAMES for contract in CONTRACTS
+        if has_manifest(model, contract) and pair_cache_key(model, contract, sui_version) not in cache
+    ]
+
+
+def warm_dependency_cache(pairs):
+    """Build the first of ``pairs`` so its git dependencies are fetched up front
+
+    Later `sui move test` runs pass --skip-fetch-latest-git-deps and reuse the
+    local package cache, rather than each re-fetching (and, when run in
+    parallel, racing on) the same Sui framework checkout. Nothing is built
+    when ``pairs`` is empty, i.e. every result comes from the cache.
+    """
+    for model, contract in pairs:
+        try:
+            subprocess.run(["sui", "move", "build"], cwd=BENCHMARK_DIR / MODELS[model] / contract,
+                           capture_output=True, timeout=SUI_TEST_TIMEOUT)
+        except (subprocess.SubprocessError, OSError):
+            pass
+        return
+
+
+async def run_all_tests(cache=None, sui_version="", jsonl_file=None, jobs=None):
+    """Test every model x contract pair, printing progress grouped by model
+
+    Each `sui move test` runs in its own package directory, so all pairs are
+    dispatched at once with at most ``jobs`` (default os.cpu_count()) builds
+    in flight. Results are awaited in submission order, which keeps them and
+    the progress output in model order. When ``jsonl_file`` is given, each result is appended to
+    it as soon as it is available, so partial runs leave their results behind.
+    """
+    semaphore = asyncio.Semaphore(jobs or os.cpu_count() or 1)
+
+    async def bounded_test(model, contract):
+        async with semaphore:
+            return await test_contract(model, contract, cache, sui_version)
+
+    # Pairs without a package manifest are resolved immediately (as zero-score
+    # results) instead of occupying one of the build slots
+    matrix = [(model, contract) for model in MODEL_NAMES for contract in CONTRACTS]
+    tasks = [
+        asyncio.create_task(
+            bounded_test(model, contract) if has_manifest(model, contract)
+            else test_contract(model, contract)
+        )
+        for model, contract in matrix
+    ]
+
+    results = []
+    for (model, contract), task in zip(matrix, tasks):
+        if contract == CONTRACTS[0]:
+            print(f"\n{'=' * 60}")
+            print(f"Testing: {model}")
+            print('=' * 60)
+
+        print(f"\n  Testing {contract}...", end=" ")
+        result = await task
+        results.append(result)
+        if jsonl_file is not None:
+            jsonl_file.write(dumps_json(result) + b"\n")
+            jsonl_file.flush()
+
+        if result["compiles"]:
+            print(f"✅ {result['tests_passed']}/{result['tests_expected']} tests | Score: {result['total_score']:.1f}/100")
+        else:
+            print(f"❌ Compilation failed | Score: {result['total_score']:.1f}/100")
+            if result["errors"]:
+                print(f"     Errors: {', '.join(result['errors'][:3])}")
+
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Sui Move translation models")
+    parser.add_argument("--no-charts", action="store_true",
+                        help="skip generating benchmark_charts.png")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="number of sui move test runs in parallel (default: CPU count)")
+    parser.add_argument("--force", action="store_true",
+                        help="ignore cached results and re-run every contract")
+    return parser.parse_args(argv)
+
 
 def main():
+    args = parse_args()
+    # One timestamp for the whole run so every artifact reports the same time
+    run_ts = datetime.now()
+
     print("=" * 60)
     print("   SUI MOVE TRANSLATION BENCHMARK")
     print("=" * 60)
     print()
 
-    results = []
-
-    for model in MODELS.keys():
-        print(f"\n{'=' * 60}")
-        print(f"Testing: {model}")
-        print('=' * 60)
+    sui_version = sui_cli_version()
+    cache_file = BENCHMARK_DIR / ".bench_cache.json"
+    # --force starts from an empty cache, so every pair is re-run and re-cached
+    cache = {} if args.force else load_result_cache(cache_file)
 
-        for contract in CONTRACTS:
-            print(f"\n  Testing {contract}...", end=" ")
-            result = test_contract(model, contract)
-            results.append(result)
+    if not args.no_charts:
+        threading.Thread(target=warm_chart_backend, daemon=True).start()
+    warm_dependency_cache(untested_pairs(cache, sui_version))
+    with open(BENCHMARK_DIR / "results.jsonl", 'wb') as jsonl_file:
+        results = asyncio.run(run_all_tests(cache, sui_version, jsonl_file, args.jobs))
 
-            if result["compiles"]:
-                print(f"✅ {result['tests_passed']}/{result['tests_expected']} tests | Score: {result['total_score']:.1f}/100")
-            else:
-                print(f"❌ Compilation failed | Score: {result['total_score']:.1f}/100")
-                if result["errors"]:
-                    print(f"     Errors: {', '.join(result['errors'][:3])}")
+    save_result_cache(cache_file, cache)
 
     print("\n" + "=" * 60)
     print("Benchmark Complete!")
     print("=" * 60)
     
+    # Per-model totals and averages, shared by the analysis and all reports
+    model_stats = summarize_models(results)
+
     # Perform statistical analysis
     print("\nPerforming statistical analysis...")
-    stats_analysis = perform_statistical_analysis(results)
+    stats_analysis = perform_statistical_analysis(results, model_stats)
     
     # Analyze errors
     print("Analyzing error patterns...")
     error_analysis = analyze_errors(results)
     
+    # Render charts in the background while the JSON and markdown reports are
+    # written; Agg draws on a private Figure, so nothing is shared between threads
+    chart_future = None
+    if not args.no_charts:
+        chart_executor = ThreadPoolExecutor(max_workers=1)
+        chart_future = chart_executor.submit(
+            generate_charts, results, stats_analysis, error_analysis, BENCHMARK_DIR, model_stats
+        )
+        chart_executor.shutdown(wait=False)  # the submitted job still runs to completion
+    
     # Get environment info
     environment_info = {
-        "sui_cli": subprocess.run(["sui", "--version"], capture_output=True, text=True).stdout.strip(),
+        "sui_cli": sui_version,
         "python": sys.version.split()[0],
         "os": f"{platform.system()} {platform.release()}",
         "platform": platform.platform()
@@ -668,53 +926,46 @@ def main():
     
     # Save enhanced results
     results_json = BENCHMARK_DIR / "benchmark_results.json"
-    with open(results_json, 'w') as f:
-        json.dump({
-            "benchmark_metadata": {
-                "version": "1.0.0",
-                "timestamp": datetime.now().isoformat(),
-                "environment": environment_info,
-                "models": MODELS_CONFIG,
-                "total_contracts": len(CONTRACTS),
-                "total_tests": sum(EXPECTED_TESTS.values())
-            },
-            "results": results,
-            "statistical_analysis": {
-                "chi_square": stats_analysis["chi_square"],
-                "confidence_intervals": stats_analysis["confidence_intervals"],
-                "pairwise_comparisons": stats_analysis["pairwise"]
-            },
-            "error_analysis": error_analysis
-        }, f, indent=2)
+    results_json.write_bytes(dumps_json({
+        "benchmark_metadata": {
+            "version": "1.0.0",
+            "timestamp": run_ts.isoformat(),
+            "environment": environment_info,
+            "models": MODELS_CONFIG,
+            "total_contracts": len(CONTRACTS),
+            "total_tests": sum(EXPECTED_TESTS.values())
+        },
+        "results": results,
+        "statistical_analysis": {
+            "chi_square": stats_analysis["chi_square"],
+            "confidence_intervals": stats_analysis["confidence_intervals"],
+            "pairwise_comparisons": stats_analysis["pairwise"]
+        },
+        "error_analysis": error_analysis
+    }, indent=True))
     print(f"\n✓ Results saved to: {results_json}")
     
-    # Generate charts
-    generate_charts(results, stats_analysis, error_analysis, BENCHMARK_DIR)
-    
     # Generate and save markdown report
-    markdown = generate_markdown_table(results, stats_analysis, error_analysis)
+    markdown = generate_markdown_table(results, stats_analysis, error_analysis, model_stats, run_ts)
     report_file = BENCHMARK_DIR / "BENCHMARK_REPORT.md"
-    with open(report_file, 'w') as f:
-        f.write(markdown)
+    report_file.write_text(markdown, encoding='utf-8', newline='\n')
+    
+    # Wait for the charts
+    if chart_future is not None:
+        print(f"✓ Charts saved to: {chart_future.result()}")
     print(f"✓ Report saved to: {report_file}")
     
     # Print summary with statistical significance
     print("\n" + "=" * 60)
     print("SUMMARY WITH STATISTICAL ANALYSIS")
     print("=" * 60)
-    for model in MODELS.keys():
-        model_results = [r for r in results if r["model"] == model]
-        avg_score = sum(r["total_score"] for r in model_results) / len(model_results)
-        compile_rate = sum(1 for r in model_results if r["compiles"]) / len(model_results) * 100
-        total_passed = sum(r["tests_passed"] for r in model_results)
-        total_expected = sum(r["tests_expected"] for r in model_results)
-        
+    for model, ms in model_stats.items():
         ci = stats_analysis["confidence_intervals"][model]
         
         print(f"\n{model}:")
-        print(f"  Average Score: {avg_score:.1f}/100")
-        print(f"  Compilation Rate: {compile_rate:.1f}%")
-        print(f"  Tests Passed: {total_passed}/{total_expected} ({ci['rate']:.1f}% [95% CI: {ci['lower']:.1f}%-{ci['upper']:.1f}%])")
+        print(f"  Average Score: {ms['avg_score']:.1f}/100")
+        print(f"  Compilation Rate: {ms['compile_rate']:.1f}%")
+        print(f"  Tests Passed: {ms['total_passed']}/{ms['total_expected']} ({ci['rate']:.1f}% [95% CI: {ci['lower']:.1f}%-{ci['upper']:.1f}%])")
     
     print(f"\n{'=' * 60}")
     print(f"Chi-square test: χ²={stats_analysis['chi_square']['statistic']:.2f}, p={stats_analysis['chi_square']['p_value']:.2e}")
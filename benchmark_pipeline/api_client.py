@@ -1,196 +1,333 @@
 """API client for the Solidity to Move translation model."""
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
+import logging
+import re
 import time
 import json
+import random
 from typing import Optional, Dict, Any
-from config import API_ROOT, API_KEY, MODEL_NAME, REQUEST_TIMEOUT, MAX_RETRIES, SYSTEM_PROMPT
+from config import (
+    API_ROOT, API_KEY, MODEL_NAME, REQUEST_TIMEOUT, GENERATION_TIMEOUT, MAX_RETRIES, BASE_BACKOFF,
+    MAX_BACKOFF, MODELS_CACHE_TTL, MAX_WORKERS, SYSTEM_PROMPT
+)
 from logger_config import get_logger
+import json_utils
 
 logger = get_logger('api_client')
 
+# Special tokens and formatting artifacts stripped from generated code. In the
+# alternation "```move" is listed before "```" so the longer marker wins.
+UNWANTED_TOKENS = (
+    "<|endoftext|>",
+    "<|end|>",
+    "<|start|>",
+    "```move",
+    "```",
+    "<dyad-write",
+    "</dyad-write>",
+)
+_UNWANTED_RE = re.compile("|".join(re.escape(token) for token in UNWANTED_TOKENS))
+
+
+def _sleep_backoff(retry_count: int) -> None:
+    """Sleep before a retry using capped exponential backoff with full jitter.
+
+    The random spread keeps concurrent workers that failed together from
+    retrying in lockstep.
+    """
+    delay = random.uniform(0, min(MAX_BACKOFF, BASE_BACKOFF * 2 ** retry_count))
+    logger.debug("Backing off for %.2fs before retry %s", delay, retry_count + 1)
+    time.sleep(delay)
+
+
+def _is_read_timeout(error: requests.exceptions.ConnectionError) -> bool:
+    """Whether a requests ConnectionError was raised for a read timeout.
+
+    requests reports read timeouts hit while reading a response body, and
+    those wrapped in a urllib3 MaxRetryError, as ConnectionError.
+    """
+    reason = error.args[0] if error.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, ReadTimeoutError)
+
 
 class TranslationAPIClient:
     """Client for interacting with the Solidity to Move translation API."""
 
-    def __init__(self, api_url: str = API_ROOT, api_key: str = API_KEY, model: str = MODEL_NAME, stream_to_console: bool = False):
+    def __init__(self, api_url: str = API_ROOT, api_key: str = API_KEY, model: str = MODEL_NAME,
+                 stream_to_console: bool = False, pool_size: int = MAX_WORKERS):
         self.api_url = api_url
         self.api_key = api_key
         self.model = model
         self.stream_to_console = stream_to_console
         self.session = requests.Session()
         self.session.headers.update({"Authorization": f"Bearer {self.api_key}"})
-
-    def list_models(self, retry_count: int = 0) -> Optional[bool]:
+        # Keep one kept-alive connection per concurrent request to the single
+        # API host. urllib3 retries failed connections and 5xx responses
+        # (honouring Retry-After), with jittered exponential backoff;
+        # translate only retries broken streams. Read errors are never
+        # retried: a POST that timed out may still be generating on the
+        # server, and sending it again would start another generation.
+        retry = Retry(
+            total=MAX_RETRIES,
+            read=False,
+            backoff_factor=BASE_BACKOFF,
+            backoff_max=MAX_BACKOFF,
+            backoff_jitter=BASE_BACKOFF,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Last answer from the tags endpoint and when it was received
+        self._models_cache: Optional[bool] = None
+        self._models_cache_ts = 0.0
+
+    def list_models(self) -> Optional[bool]:
         """
         Checks whether the ollama endpoint returns our configured model.
 
+        A successful answer is reused for MODELS_CACHE_TTL seconds; failed
+        requests are not cached.
+
         Returns:
             True if the configured model is available, False otherwise
         """
+        if self._models_cache is not None and time.time() - self._models_cache_ts < MODELS_CACHE_TTL:
+            logger.debug("Using cached model availability for '%s': %s", self.model, self._models_cache)
+            return self._models_cache
+
+        tags_url = self.api_url.replace('/api/generate', '/api/tags')
+
+        # Transient failures are retried by the session's urllib3 Retry policy
         try:
-            tags_url = self.api_url.replace('/api/generate', '/api/tags')
-            logger.debug(f"Fetching models list from: {tags_url}")
+            logger.debug("Fetching models list from: %s", tags_url)
 
             response = self.session.get(
                 tags_url,
                 timeout=REQUEST_TIMEOUT
             )
 
-            logger.debug(f"List models response: status={response.status_code}")
+            logger.debug("List models response: status=%s", response.status_code)
 
             if response.status_code == 200:
                 data = response.json()
                 models = data.get('models', [])
-                logger.debug(f"Received {len(models)} models from endpoint")
+                logger.debug("Received %s models from endpoint", len(models))
 
                 # List is like [solmover:tag<latest>]
                 model_names = [model.get('name', '').split(":")[0] for model in models]
 
-                if self.model in model_names:
-                    logger.info(f"✓ Model '{self.model}' is available")
-                    logger.debug(f"Available models: {model_names}")
-                    return True
+                available = self.model in model_names
+                if available:
+                    logger.info("✓ Model '%s' is available", self.model)
+                    logger.debug("Available models: %s", model_names)
                 else:
-                    logger.warning(f"✗ Model '{self.model}' not found. Available models: {model_names}")
-                    return False
-            else:
-                logger.error(f"Failed to list models: Status {response.status_code}, Response: {response.text[:200]}")
-                if retry_count < MAX_RETRIES:
-                    logger.info(f"Retrying list_models... (attempt {retry_count + 1}/{MAX_RETRIES})")
-                    time.sleep(2 ** retry_count)
-                    return self.list_models(retry_count + 1)
-                return False
+                    logger.warning("✗ Model '%s' not found. Available models: %s", self.model, model_names)
+
+                self._models_cache = available
+                self._models_cache_ts = time.time()
+                return available
+
+            logger.error("Failed to list models: Status %s, Response: %s", response.status_code, response.text[:200])
+            return False
 
         except Exception as e:
-            logger.error(f"Error listing models: {e}", exc_info=True)
-            if retry_count < MAX_RETRIES:
-                logger.info(f"Retrying list_models after exception... (attempt {retry_count + 1}/{MAX_RETRIES})")
-                time.sleep(2 ** retry_count)
-                return self.list_models(retry_count + 1)
+            logger.error("Error listing models: %s", e, exc_info=True)
             return False
 
 
-    def translate(self, solidity_code: str, retry_count: int = 0) -> Optional[Dict[str, Any]]:
+    def translate(self, solidity_code: str) -> Optional[Dict[str, Any]]:
         """
         Translate Solidity code to Sui Move.
 
+        The model output is only streamed token by token when it is echoed
+        to the console; otherwise the whole completion is requested as a
+        single JSON response. A stream may pause up to REQUEST_TIMEOUT
+        between tokens, while a single response gets GENERATION_TIMEOUT for
+        the whole generation.
+
+        Connection errors and 5xx responses are retried by the session's
+        Retry policy; a response body that breaks while being read is
+        retried here, up to MAX_RETRIES times. Read timeouts are not
+        retried. The reported response time is that of the last attempt.
+
+        The client is shared by the benchmark worker threads, so this method
+        must not change session state (headers, adapters, cookies) and keeps
+        all per-request state in locals.
+
         Args:
             solidity_code: The Solidity source code to translate
-            retry_count: Current retry attempt number
 
         Returns:
             Dictionary with translation results including generated code and metadata,
             or None if translation failed
         """
-        try:
-            payload = {
-                "model": self.model,
-                "prompt": solidity_code,
-                "system": SYSTEM_PROMPT,
-                "stream": True
-            }
-
-            logger.debug(f"Preparing translation request - code length: {len(solidity_code)} chars")
-            logger.debug(f"Using model: {self.model}, endpoint: {self.api_url}")
-
-            start_time = time.time()
-            logger.info("Sending request to translation endpoint...")
-            response = self.session.post(
-                self.api_url,
-                json=payload,
-                timeout=REQUEST_TIMEOUT,
-                stream=True  # Enable streaming
-            )
-            logger.info(f"API responded with status: {response.status_code}")
-
-            if response.status_code == 200:
-                # Parse streaming response (newline-delimited JSON)
-                logger.info("Processing streaming response...")
-                generated_code = ""
-                chunk_count = 0
-
-                for line in response.iter_lines():
-                    if line:
-                        try:
-                            chunk = json.loads(line.decode('utf-8'))
-                            token = chunk.get("response", "")
-                            generated_code += token
-                            chunk_count += 1
-
-                            # Stream to console if enabled
-                            if self.stream_to_console and token:
-                                print(token, end='', flush=True)
-
-                            if chunk_count % 50 == 0:
-                                logger.debug(f"Processed {chunk_count} chunks, generated {len(generated_code)} chars")
-
-                            if chunk.get("done", False):
-                                logger.debug(f"Stream complete after {chunk_count} chunks")
-                                if self.stream_to_console:
-                                    print()  # Newline after streaming complete
-                                break
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Failed to parse streaming chunk: {line[:100]}... Error: {e}")
-                            continue
+        payload = {
+            "model": self.model,
+            "prompt": solidity_code,
+            "system": SYSTEM_PROMPT,
+            "stream": self.stream_to_console
+        }
+
+        logger.debug("Preparing translation request - code length: %s chars", len(solidity_code))
+        logger.debug("Using model: %s, endpoint: %s", self.model, self.api_url)
+
+        # A single response only starts once the whole generation is done
+        read_timeout = REQUEST_TIMEOUT if self.stream_to_console else GENERATION_TIMEOUT
+
+        result = None
+        for attempt in range(MAX_RETRIES + 1):
+            streaming = False
+            try:
+                start_time = time.time()
+                logger.info("Sending request to translation endpoint...")
+                response = self.session.post(
+                    self.api_url,
+                    json=payload,
+                    timeout=(REQUEST_TIMEOUT, read_timeout),
+                    stream=True  # Read the body below, so a broken one can be retried
+                )
+                logger.info("API responded with status: %s", response.status_code)
+
+                if response.status_code == 200:
+                    streaming = True
+                    if self.stream_to_console:
+                        generated_code = self._read_stream(response)
+                    else:
+                        # The whole completion arrives as a single JSON object
+                        logger.info("Reading translation response...")
+                        generated_code = json_utils.loads(response.content).get("response", "")
+
+                    end_time = time.time()
+                    response_time = end_time - start_time
+
+                    logger.info("Translation completed in %.2fs", response_time)
+                    logger.debug("Generated code length: %s chars", len(generated_code))
+
+                    cleaned_code = self._clean_generated_code(generated_code)
+                    logger.debug("Cleaned code length: %s chars", len(cleaned_code))
+
+                    return {
+                        "success": True,
+                        "generated_code": cleaned_code,
+                        "raw_generated_code": generated_code,
+                        "response_time": response_time,
+                        "status_code": response.status_code,
+                        "raw_response": {"response": generated_code}
+                    }
 
                 end_time = time.time()
-                response_time = end_time - start_time
-
-                logger.info(f"Translation completed in {response_time:.2f}s")
-                logger.debug(f"Generated code length: {len(generated_code)} chars")
-
-                cleaned_code = self._clean_generated_code(generated_code)
-                logger.debug(f"Cleaned code length: {len(cleaned_code)} chars")
+                error_message = f"API returned status code {response.status_code}: {response.text}"
+                logger.error("Translation failed: %s", error_message)
 
                 return {
-                    "success": True,
-                    "generated_code": cleaned_code,
-                    "raw_generated_code": generated_code,
-                    "response_time": response_time,
+                    "success": False,
+                    "error": error_message,
                     "status_code": response.status_code,
-                    "raw_response": {"response": generated_code}
+                    "response_time": end_time - start_time
                 }
-            else:
-                end_time = time.time()
-                error_message = f"API returned status code {response.status_code}: {response.text}"
-                logger.error(f"Translation failed: {error_message}")
 
-                if response.status_code >= 500 and retry_count < MAX_RETRIES:
-                    logger.info(f"Retrying translation... (attempt {retry_count + 1}/{MAX_RETRIES})")
-                    time.sleep(2 ** retry_count)  # Exponential backoff
-                    return self.translate(solidity_code, retry_count + 1)
+            except requests.exceptions.Timeout:
+                return self._timeout_result(read_timeout)
+
+            except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+                # Read timeouts while reading the body surface as ConnectionError
+                if isinstance(e, requests.exceptions.ConnectionError) and _is_read_timeout(e):
+                    return self._timeout_result(read_timeout)
+
+                error_message = f"Connection error: {str(e)}"
+                logger.error(error_message)
+
+                result = {
+                    "success": False,
+                    "error": error_message,
+                    "response_time": 0 if not streaming else time.time() - start_time
+                }
+                if not streaming:
+                    return result
 
+            except Exception as e:
+                error_message = f"Unexpected error: {str(e)}"
+                logger.error("Translation failed with unexpected error: %s", error_message, exc_info=True)
                 return {
                     "success": False,
                     "error": error_message,
-                    "status_code": response.status_code,
-                    "response_time": end_time - start_time
+                    "response_time": 0
                 }
 
-        except requests.exceptions.Timeout:
-            error_message = f"Request timed out after {REQUEST_TIMEOUT} seconds"
-            logger.error(error_message)
+            if attempt < MAX_RETRIES:
+                logger.info("Retrying translation after the response broke off... (attempt %s/%s)", attempt + 1, MAX_RETRIES)
+                _sleep_backoff(attempt)
 
-            if retry_count < MAX_RETRIES:
-                logger.info(f"Retrying translation after timeout... (attempt {retry_count + 1}/{MAX_RETRIES})")
-                time.sleep(2 ** retry_count)
-                return self.translate(solidity_code, retry_count + 1)
+        return result
 
-            return {
-                "success": False,
-                "error": error_message,
-                "response_time": REQUEST_TIMEOUT
-            }
+    def _timeout_result(self, timeout: float) -> Dict[str, Any]:
+        """Log a translation that hit its read timeout and return its failed result."""
+        error_message = f"Request timed out after {timeout} seconds"
+        logger.error(error_message)
 
-        except Exception as e:
-            error_message = f"Unexpected error: {str(e)}"
-            logger.error(f"Translation failed with unexpected error: {error_message}", exc_info=True)
-            return {
-                "success": False,
-                "error": error_message,
-                "response_time": 0
-            }
+        return {
+            "success": False,
+            "error": error_message,
+            "response_time": timeout
+        }
+
+    def _read_stream(self, response: requests.Response) -> str:
+        """
+        Read a streamed (newline-delimited JSON) response, echoing each token
+        to the console as it arrives.
+
+        Args:
+            response: Response to a request sent with "stream": true
+
+        Returns:
+            The generated text
+        """
+        logger.info("Processing streaming response...")
+        # Tokens are collected in a list and joined once at the end.
+        # Everything the loop needs is bound to locals up front, and
+        # the progress log is only maintained when debug is enabled.
+        tokens = []
+        append_token = tokens.append
+        generated_length = 0
+        chunk_count = 0
+        json_loads = json_utils.loads
+        log_progress = logger.isEnabledFor(logging.DEBUG)
+
+        for line in response.iter_lines():
+            if line:
+                try:
+                    chunk = json_loads(line)  # UTF-8 bytes are decoded by the parser
+                    token = chunk.get("response", "")
+                    append_token(token)
+                    chunk_count += 1
+
+                    if token:
+                        print(token, end='', flush=True)
+
+                    if log_progress:
+                        generated_length += len(token)
+                        if chunk_count % 50 == 0:
+                            logger.debug("Processed %s chunks, generated %s chars", chunk_count, generated_length)
+
+                    if chunk.get("done", False):
+                        logger.debug("Stream complete after %s chunks", chunk_count)
+                        print()  # Newline after streaming complete
+                        break
+                except json.JSONDecodeError as e:
+                    logger.warning("Failed to parse streaming chunk: %s... Error: %s", line[:100], e)
+                    continue
+
+        return "".join(tokens)
 
     def _clean_generated_code(self, code: str) -> str:
         """
@@ -206,30 +343,14 @@ class TranslationAPIClient:
             logger.debug("Empty code provided for cleaning")
             return code
 
-        original_length = len(code)
-
-        unwanted_tokens = [
-            "<|endoftext|>",
-            "<|end|>",
-            "<|start|>",
-            "```move",
-            "```",
-            "<dyad-write",
-            "</dyad-write>",
-        ]
+        cleaned = _UNWANTED_RE.sub("", code).strip()
 
-        cleaned = code
-        removed_tokens = []
-        for token in unwanted_tokens:
-            if token in cleaned:
-                removed_tokens.append(token)
-                cleaned = cleaned.replace(token, "")
-
-        cleaned = cleaned.strip()
-
-        if removed_tokens:
-            logger.debug(f"Removed unwanted tokens: {removed_tokens}")
-        logger.debug(f"Code cleaning: {original_length} -> {len(cleaned)} chars")
+        if logger.isEnabledFor(logging.DEBUG):
+            found = set(_UNWANTED_RE.findall(code))
+            removed_tokens = [token for token in UNWANTED_TOKENS if token in found]
+            if removed_tokens:
+                logger.debug("Removed unwanted tokens: %s", removed_tokens)
+            logger.debug("Code cleaning: %s -> %s chars", len(code), len(cleaned))
 
         return cleaned
 
@@ -237,17 +358,34 @@ class TranslationAPIClient:
         """
         Test if the API is accessible and the configured model is available.
 
+        The endpoint is first probed with a single HEAD request that is not
+        retried, so an unreachable server fails the test straight away
+        instead of after the full retry backoff. Only then is the model list
+        fetched.
+
         Returns:
             True if connection is successful and model is available, False otherwise
         """
+        tags_url = self.api_url.replace('/api/generate', '/api/tags')
         try:
-            logger.info(f"Testing connection to {self.api_url}...")
+            logger.info("Testing connection to %s...", self.api_url)
+            # Plain requests.head() has no Retry policy; 405 still proves the
+            # server is up if it does not serve HEAD on this route
+            probe = requests.head(tags_url, headers=self.session.headers, timeout=REQUEST_TIMEOUT)
+            logger.debug("Connection probe response: status=%s", probe.status_code)
+            if probe.status_code not in (200, 405):
+                logger.error("✗ Connection test failed: Status %s from %s", probe.status_code, tags_url)
+                return False
+
             result = self.list_models()
             if result:
                 logger.info("✓ Connection test successful")
             else:
                 logger.error("✗ Connection test failed: Model not available")
             return result
+        except requests.exceptions.RequestException as e:
+            logger.error("✗ Connection test failed: %s", e)
+            return False
         except Exception as e:
-            logger.error(f"✗ Connection test failed: {e}", exc_info=True)
+            logger.error("✗ Connection test failed: %s", e, exc_info=True)
             return False
@@ -1,21 +1,36 @@
 """Main benchmark runner for the Solidity to Move translation model."""
 
 import os
-import json
+import queue
+import threading
 import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
 
 from api_client import TranslationAPIClient
 from evaluator import MoveCodeEvaluator, EvaluationResult
-from config import SOLIDITY_DIR, SUI_MOVE_DIR, TEST_CASES, RESULTS_DIR
+from config import SOLIDITY_DIR, SUI_MOVE_DIR, TEST_CASES, RESULTS_DIR, MAX_WORKERS, SAVE_RAW_STREAMING
 from logger_config import get_logger, setup_logging, get_default_log_file
+import json_utils
 
 # Initialize logger for this module
 logger = get_logger('benchmark_runner')
 
 
+def _first_file(directory: str, suffix: str) -> Optional[Path]:
+    """Return the first non-hidden file in directory ending with suffix."""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and not entry.name.startswith('.') and entry.is_file():
+                    return Path(entry.path)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return None
+
+
 @dataclass
 class BenchmarkCase:
     """A single benchmark test case."""
@@ -26,6 +41,16 @@ class BenchmarkCase:
     reference_move_code: str
 
 
+# Fields kept out of the results JSON: generated code is saved to its own
+# files and the line diff is only useful while evaluating
+_UNSAVED_FIELDS = frozenset({"generated_code", "line_diff"})
+
+
+def _results_dict(fields: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """asdict() factory that drops the fields not written to the results JSON."""
+    return {name: value for name, value in fields if name not in _UNSAVED_FIELDS}
+
+
 @dataclass
 class BenchmarkResult:
     """Results from running a benchmark case."""
@@ -41,42 +66,90 @@ class BenchmarkResult:
 class BenchmarkRunner:
     """Orchestrates the benchmark pipeline."""
 
-    def __init__(self, stream_to_console: bool = False):
-        self.api_client = TranslationAPIClient(stream_to_console=stream_to_console)
+    def __init__(self, stream_to_console: bool = False, max_workers: int = MAX_WORKERS,
+                 save_raw_output: bool = SAVE_RAW_STREAMING):
+        # Tokens streamed by concurrent cases would interleave on the console
+        self.max_workers = 1 if stream_to_console else max_workers
+        # One client shared by all workers, with a connection per worker
+        self.api_client = TranslationAPIClient(stream_to_console=stream_to_console,
+                                               pool_size=self.max_workers)
         self.evaluator = MoveCodeEvaluator()
         self.results: List[BenchmarkResult] = []
+        # Case name -> (Solidity file, reference Move file), built on first use
+        self._case_files: Optional[Dict[str, Tuple[Optional[Path], Optional[Path]]]] = None
+
+        # Raw model outputs are only kept on disk when asked for
+        self.save_raw_output = save_raw_output
+        self.stream_log_dir = os.path.join(RESULTS_DIR, "streaming_logs")
+        # Raw outputs are written by a background thread, so workers move
+        # straight on to evaluation; run_all_benchmarks waits for the queue
+        self._write_queue: "queue.Queue[Tuple[str, bytes]]" = queue.Queue()
+        if save_raw_output:
+            os.makedirs(self.stream_log_dir, exist_ok=True)
+            threading.Thread(target=self._write_files, daemon=True).start()
+
+    def _write_files(self):
+        """Write queued (path, data) pairs to disk until the process exits."""
+        while True:
+            path, data = self._write_queue.get()
+            try:
+                # Each file is a single prebuilt buffer, so skip buffered I/O
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+                logger.debug("Wrote %s bytes to: %s", len(data), path)
+            except OSError as e:
+                logger.error("Failed to write %s: %s", path, e)
+            finally:
+                self._write_queue.task_done()
+
+    def _discover_cases(self) -> Dict[str, Tuple[Optional[Path], Optional[Path]]]:
+        """Scan the benchmark directories once for every case's source files."""
+        case_files = {}
+        try:
+            with os.scandir(SOLIDITY_DIR) as entries:
+                case_dirs = [entry.name for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            case_dirs = []
+        for case_name in case_dirs:
+            case_files[case_name] = (
+                _first_file(os.path.join(SOLIDITY_DIR, case_name), ".sol"),
+                _first_file(os.path.join(SUI_MOVE_DIR, case_name, "sources"), ".move"),
+            )
+        logger.debug("Discovered %s test case directories", len(case_files))
+        return case_files
 
     def load_test_case(self, case_name: str) -> Optional[BenchmarkCase]:
         """Load a single test case from the benchmark directory."""
         try:
-            logger.debug(f"Loading test case: {case_name}")
+            logger.debug("Loading test case: %s", case_name)
+            if self._case_files is None:
+                self._case_files = self._discover_cases()
+            sol_file, move_file = self._case_files.get(case_name, (None, None))
 
             # Find Solidity file
-            sol_dir = Path(SOLIDITY_DIR) / case_name
-            sol_files = list(sol_dir.glob("*.sol"))
-            if not sol_files:
-                logger.warning(f"No Solidity file found for {case_name} in {sol_dir}")
+            if sol_file is None:
+                sol_dir = Path(SOLIDITY_DIR) / case_name
+                logger.warning("No Solidity file found for %s in %s", case_name, sol_dir)
                 return None
-            sol_file = sol_files[0]
-            logger.debug(f"Found Solidity file: {sol_file}")
+            logger.debug("Found Solidity file: %s", sol_file)
 
             # Find Move file
-            move_dir = Path(SUI_MOVE_DIR) / case_name / "sources"
-            move_files = list(move_dir.glob("*.move"))
-            if not move_files:
-                logger.warning(f"No Move file found for {case_name} in {move_dir}")
+            if move_file is None:
+                move_dir = Path(SUI_MOVE_DIR) / case_name / "sources"
+                logger.warning("No Move file found for %s in %s", case_name, move_dir)
                 return None
-            move_file = move_files[0]
-            logger.debug(f"Found Move file: {move_file}")
+            logger.debug("Found Move file: %s", move_file)
 
             # Read contents
-            with open(sol_file, 'r') as f:
-                solidity_code = f.read()
+            solidity_code = sol_file.read_text()
+            reference_move_code = move_file.read_text()
 
-            with open(move_file, 'r') as f:
-                reference_move_code = f.read()
-
-            logger.info(f"Loaded test case '{case_name}': {len(solidity_code)} chars Solidity, {len(reference_move_code)} chars Move")
+            logger.info("Loaded test case '%s': %s chars Solidity, %s chars Move", case_name, len(solidity_code), len(reference_move_code))
 
             return BenchmarkCase(
                 name=case_name,
@@ -87,24 +160,24 @@ class BenchmarkRunner:
             )
 
         except Exception as e:
-            logger.error(f"Error loading test case {case_name}: {e}", exc_info=True)
+            logger.error("Error loading test case %s: %s", case_name, e, exc_info=True)
             return None
 
     def run_single_benchmark(self, case: BenchmarkCase) -> BenchmarkResult:
         """Run benchmark for a single test case."""
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Running benchmark: {case.name}")
-        logger.info(f"{'='*60}")
+        logger.info("\n%s", '=' * 60)
+        logger.info("Running benchmark: %s", case.name)
+        logger.info("%s", '=' * 60)
 
         timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
 
         # Call API for translation
-        logger.info(f"[{case.name}] Starting translation...")
+        logger.info("[%s] Starting translation...", case.name)
         api_result = self.api_client.translate(case.solidity_code)
 
         if not api_result or not api_result.get("success"):
             error_msg = api_result.get("error", "Unknown error") if api_result else "No response from API"
-            logger.error(f"[{case.name}] Translation failed: {error_msg}")
+            logger.error("[%s] Translation failed: %s", case.name, error_msg)
             return BenchmarkResult(
                 test_case=case.name,
                 success=False,
@@ -119,37 +192,36 @@ class BenchmarkRunner:
         raw_generated_code = api_result.get("raw_generated_code", "")
         response_time = api_result.get("response_time", 0)
 
-        logger.info(f"[{case.name}] Translation completed in {response_time:.2f}s")
+        logger.info("[%s] Translation completed in %.2fs", case.name, response_time)
 
-        # Save raw output immediately to a streaming log file
-        if raw_generated_code:
-            stream_log_dir = os.path.join(RESULTS_DIR, "streaming_logs")
-            os.makedirs(stream_log_dir, exist_ok=True)
-            stream_log_file = os.path.join(stream_log_dir, f"{case.name}_raw_output.move")
-            with open(stream_log_file, 'w') as f:
-                f.write(f"# Raw streaming output for {case.name}\n")
-                f.write(f"# Generated at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"# Response time: {response_time:.2f}s\n\n")
-                f.write(raw_generated_code)
-            logger.debug(f"[{case.name}] Saved raw streaming output to: {stream_log_file}")
+        # Queue the raw output for the streaming log file
+        if self.save_raw_output and raw_generated_code:
+            stream_log_file = os.path.join(self.stream_log_dir, f"{case.name}_raw_output.move")
+            self._write_queue.put((stream_log_file, (
+                f"# Raw streaming output for {case.name}\n"
+                f"# Generated at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"# Response time: {response_time:.2f}s\n\n"
+                f"{raw_generated_code}"
+            ).encode('utf-8')))
+            logger.debug("[%s] Queued raw streaming output for: %s", case.name, stream_log_file)
 
         # Evaluate the generated code
-        logger.info(f"[{case.name}] Starting evaluation...")
+        logger.info("[%s] Starting evaluation...", case.name)
         evaluation = self.evaluator.evaluate(
             generated_code,
             case.reference_move_code,
             case.name
         )
 
-        logger.info(f"[{case.name}] Evaluation scores:")
-        logger.info(f"  - Syntax: {evaluation.syntax_score:.1f}/100")
-        logger.info(f"  - Similarity: {evaluation.similarity_score:.1f}/100")
-        logger.info(f"  - Structure: {evaluation.structure_score:.1f}/100")
-        logger.info(f"  - BLEU: {evaluation.bleu_score:.1f}/100")
-        logger.info(f"  - Semantic: {evaluation.semantic_score:.1f}/100")
+        logger.info("[%s] Evaluation scores:", case.name)
+        logger.info("  - Syntax: %.1f/100", evaluation.syntax_score)
+        logger.info("  - Similarity: %.1f/100", evaluation.similarity_score)
+        logger.info("  - Structure: %.1f/100", evaluation.structure_score)
+        logger.info("  - BLEU: %.1f/100", evaluation.bleu_score)
+        logger.info("  - Semantic: %.1f/100", evaluation.semantic_score)
         if evaluation.compilable is not None:
-            logger.info(f"  - Compilable: {'Yes' if evaluation.compilable else 'No'}")
-        logger.info(f"  - Overall: {'PASS' if evaluation.passed else 'FAIL'}")
+            logger.info("  - Compilable: %s", 'Yes' if evaluation.compilable else 'No')
+        logger.info("  - Overall: %s", 'PASS' if evaluation.passed else 'FAIL')
 
         return BenchmarkResult(
             test_case=case.name,
@@ -161,6 +233,15 @@ class BenchmarkRunner:
             timestamp=timestamp
         )
 
+    def _load_and_run(self, idx: int, total: int, case_name: str) -> Optional[BenchmarkResult]:
+        """Load and run a single test case, returning None if it cannot be loaded."""
+        logger.info("\n[%s/%s] Processing test case: %s", idx, total, case_name)
+        case = self.load_test_case(case_name)
+        if not case:
+            logger.warning("Skipping %s due to loading errors", case_name)
+            return None
+        return self.run_single_benchmark(case)
+
     def run_all_benchmarks(self, test_cases: List[str] = None) -> List[BenchmarkResult]:
         """Run benchmarks for all test cases."""
         if test_cases is None:
@@ -169,7 +250,7 @@ class BenchmarkRunner:
         logger.info("\n" + "=" * 60)
         logger.info("SOLIDITY TO MOVE TRANSLATION BENCHMARK")
         logger.info("=" * 60)
-        logger.debug(f"Test cases to run: {test_cases}")
+        logger.debug("Test cases to run: %s", test_cases)
 
         # Test API connection first
         logger.info("\nTesting API connection...")
@@ -179,18 +260,27 @@ class BenchmarkRunner:
 
         logger.info("API connection successful!")
 
-        # Load and run all test cases
-        logger.info(f"\nPreparing to run {len(test_cases)} test cases...")
-        for idx, case_name in enumerate(test_cases, 1):
-            logger.info(f"\n[{idx}/{len(test_cases)}] Processing test case: {case_name}")
-            case = self.load_test_case(case_name)
-            if case:
-                result = self.run_single_benchmark(case)
-                self.results.append(result)
-            else:
-                logger.warning(f"Skipping {case_name} due to loading errors")
-
-        logger.info(f"\nCompleted {len(self.results)}/{len(test_cases)} test cases")
+        # Index the case directories before the workers start looking up cases
+        self._case_files = self._discover_cases()
+
+        # Load and run all test cases; each one is dominated by waiting on the
+        # API, so up to max_workers translations are in flight at once
+        logger.info("\nPreparing to run %s test cases...", len(test_cases))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._load_and_run, idx, len(test_cases), case_name)
+                for idx, case_name in enumerate(test_cases, 1)
+            ]
+            # Collected in submission order, so results keep the test case order
+            for future in futures:
+                result = future.result()
+                if result:
+                    self.results.append(result)
+
+        # Make sure every streaming log is on disk before reporting completion
+        self._write_queue.join()
+
+        logger.info("\nCompleted %s/%s test cases", len(self.results), len(test_cases))
         return self.results
 
     def save_results(self, output_dir: str = None):
@@ -198,7 +288,7 @@ class BenchmarkRunner:
         if output_dir is None:
             output_dir = RESULTS_DIR
 
-        logger.debug(f"Saving results to directory: {output_dir}")
+        logger.debug("Saving results to directory: %s", output_dir)
         os.makedirs(output_dir, exist_ok=True)
 
         # Generate timestamp for this run
@@ -207,42 +297,23 @@ class BenchmarkRunner:
 
         # Convert results to serializable format
         logger.debug("Serializing benchmark results...")
-        serializable_results = []
-        for result in self.results:
-            result_dict = {
-                "test_case": result.test_case,
-                "success": result.success,
-                "error": result.error,
-                "response_time": result.response_time,
-                "timestamp": result.timestamp,
-            }
-
-            if result.evaluation:
-                result_dict["evaluation"] = {
-                    "syntax_score": result.evaluation.syntax_score,
-                    "similarity_score": result.evaluation.similarity_score,
-                    "structure_score": result.evaluation.structure_score,
-                    "bleu_score": result.evaluation.bleu_score,
-                    "semantic_score": result.evaluation.semantic_score,
-                    "compilable": result.evaluation.compilable,
-                    "passed": result.evaluation.passed,
-                    "metrics": result.evaluation.metrics,
-                }
-
-            serializable_results.append(result_dict)
+        serializable_results = [
+            asdict(result, dict_factory=_results_dict) for result in self.results
+        ]
+        passed = sum(1 for r in self.results if r.evaluation and r.evaluation.passed)
 
         # Save JSON results
-        logger.debug(f"Writing results to: {results_file}")
-        with open(results_file, 'w') as f:
-            json.dump({
+        logger.debug("Writing results to: %s", results_file)
+        with open(results_file, 'wb') as f:
+            f.write(json_utils.dumps({
                 "timestamp": timestamp,
                 "total_tests": len(self.results),
-                "passed": sum(1 for r in self.results if r.evaluation and r.evaluation.passed),
-                "failed": sum(1 for r in self.results if not r.evaluation or not r.evaluation.passed),
+                "passed": passed,
+                "failed": len(self.results) - passed,
                 "results": serializable_results
-            }, f, indent=2)
+            }, indent=True))
 
-        logger.info(f"\nResults saved to: {results_file}")
+        logger.info("\nResults saved to: %s", results_file)
 
         # Save generated code for each test case (both raw and cleaned)
         logger.debug("Saving generated code files...")
@@ -255,9 +326,9 @@ class BenchmarkRunner:
                 )
                 with open(code_file, 'w') as f:
                     f.write(result.generated_code)
-                logger.debug(f"Saved cleaned code: {code_file}")
+                logger.debug("Saved cleaned code: %s", code_file)
 
-        logger.info(f"Saved {len(self.results)} generated code files")
+        logger.info("Saved %s generated code files", len(self.results))
         return results_file
 
     def print_summary(self):
@@ -271,46 +342,59 @@ class BenchmarkRunner:
         logger.info("=" * 60)
 
         total = len(self.results)
-        successful = sum(1 for r in self.results if r.success)
-        passed = sum(1 for r in self.results if r.evaluation and r.evaluation.passed)
-
-        logger.info(f"\nTotal test cases: {total}")
-        logger.info(f"Successful translations: {successful}/{total}")
-        logger.info(f"Passed evaluations: {passed}/{total}")
+        successful = passed = evaluated = 0
+        compilable_count = non_compilable_count = 0
+        total_response_time = 0.0
+        sum_syntax = sum_similarity = sum_structure = sum_bleu = sum_semantic = 0.0
+
+        # Gather every count and score total in a single pass over the results
+        for r in self.results:
+            total_response_time += r.response_time
+            if r.success:
+                successful += 1
+            e = r.evaluation
+            if not e:
+                continue
+            evaluated += 1
+            if e.passed:
+                passed += 1
+            sum_syntax += e.syntax_score
+            sum_similarity += e.similarity_score
+            sum_structure += e.structure_score
+            sum_bleu += e.bleu_score
+            sum_semantic += e.semantic_score
+            if e.compilable is True:
+                compilable_count += 1
+            elif e.compilable is False:
+                non_compilable_count += 1
+
+        logger.info("\nTotal test cases: %s", total)
+        logger.info("Successful translations: %s/%s", successful, total)
+        logger.info("Passed evaluations: %s/%s", passed, total)
 
         if successful > 0:
-            avg_response_time = sum(r.response_time for r in self.results) / len(self.results)
-            logger.info(f"Average response time: {avg_response_time:.2f}s")
+            avg_response_time = total_response_time / total
+            logger.info("Average response time: %.2fs", avg_response_time)
 
         # Score breakdown
-        if any(r.evaluation for r in self.results):
-            evals_with_scores = [r.evaluation for r in self.results if r.evaluation]
-            if evals_with_scores:
-                avg_syntax = sum(e.syntax_score for e in evals_with_scores) / len(evals_with_scores)
-                avg_similarity = sum(e.similarity_score for e in evals_with_scores) / len(evals_with_scores)
-                avg_structure = sum(e.structure_score for e in evals_with_scores) / len(evals_with_scores)
-                avg_bleu = sum(e.bleu_score for e in evals_with_scores) / len(evals_with_scores)
-                avg_semantic = sum(e.semantic_score for e in evals_with_scores) / len(evals_with_scores)
-
-                logger.info(f"\nAverage scores:")
-                logger.info(f"  - Syntax: {avg_syntax:.1f}/100")
-                logger.info(f"  - Similarity: {avg_similarity:.1f}/100")
-                logger.info(f"  - Structure: {avg_structure:.1f}/100")
-                logger.info(f"  - BLEU: {avg_bleu:.1f}/100")
-                logger.info(f"  - Semantic: {avg_semantic:.1f}/100")
-
-                # Compilation stats
-                compilable_count = sum(1 for e in evals_with_scores if e.compilable is True)
-                non_compilable_count = sum(1 for e in evals_with_scores if e.compilable is False)
-                if compilable_count > 0 or non_compilable_count > 0:
-                    total_checked = compilable_count + non_compilable_count
-                    logger.info(f"  - Compilation rate: {compilable_count}/{total_checked} ({compilable_count/total_checked*100:.1f}%)")
+        if evaluated:
+            logger.info("\nAverage scores:")
+            logger.info("  - Syntax: %.1f/100", sum_syntax / evaluated)
+            logger.info("  - Similarity: %.1f/100", sum_similarity / evaluated)
+            logger.info("  - Structure: %.1f/100", sum_structure / evaluated)
+            logger.info("  - BLEU: %.1f/100", sum_bleu / evaluated)
+            logger.info("  - Semantic: %.1f/100", sum_semantic / evaluated)
+
+            # Compilation stats
+            if compilable_count > 0 or non_compilable_count > 0:
+                total_checked = compilable_count + non_compilable_count
+                logger.info("  - Compilation rate: %s/%s (%.1f%%)", compilable_count, total_checked, compilable_count / total_checked * 100)
 
         # Per-test results
-        logger.info(f"\nPer-test results:")
+        logger.info("\nPer-test results:")
         for result in self.results:
             status = "PASS" if result.evaluation and result.evaluation.passed else "FAIL"
-            logger.info(f"  {result.test_case:20s} - {status}")
+            logger.info("  %-20s - %s", result.test_case, status)
 
 
 def main():
@@ -321,7 +405,7 @@ def main():
 
     logger.info("=" * 60)
     logger.info("Benchmark Pipeline Started")
-    logger.info(f"Log file: {log_file}")
+    logger.info("Log file: %s", log_file)
     logger.info("=" * 60)
 
     runner = BenchmarkRunner()
@@ -1,11 +1,63 @@
 """Compare multiple benchmark results for model evaluation."""
 
-import json
 import os
 import sys
-from pathlib import Path
-from typing import List, Dict, Any
-from datetime import datetime
+from array import array
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple, Callable, Iterator, TextIO
+
+import json_utils
+
+# Upper bound on result files read at the same time
+MAX_LOAD_WORKERS = 16
+
+# Shared stand-in for a missing "metrics" dict, so rows without one allocate nothing
+_EMPTY: Dict[str, Any] = {}
+
+# Keys produced by calculate_summary_stats, in the CSV's (alphabetical) column order
+STATS_FIELDS = (
+    "avg_bleu",
+    "avg_response_time",
+    "avg_semantic",
+    "avg_similarity",
+    "avg_structure",
+    "avg_syntax",
+    "compilation_rate",
+    "empty_response_rate",
+    "failed",
+    "pass_rate",
+    "passed",
+    "total_tests",
+)
+
+# Summary table cell for a metric a run has no value for
+_NA_CELL = f"{'N/A':<20}"
+
+# How the best performers block prints a metric's value
+_VALUE_FORMATTERS: Dict[str, Callable[[float], str]] = {
+    "pass_rate": lambda v: f"{v:.1f}%",
+    "compilation_rate": lambda v: f"{v:.1f}%",
+    "empty_response_rate": lambda v: f"{v:.1f}%",
+    "avg_response_time": lambda v: f"{v:.2f}s",
+}
+
+# Inputs of the composite score; every summarized run has all four keys
+_composite_inputs = itemgetter("avg_bleu", "avg_semantic", "compilation_rate", "pass_rate")
+
+
+def _format_score(value: float) -> str:
+    """Default best performers value format: one decimal score."""
+    return f"{value:.1f}"
+
+
+def _cell_formatter(fmt: str, suffix: str) -> Callable[[Any], str]:
+    """Build the summary table cell formatter for one metric."""
+    if fmt == "d":
+        return lambda value: _NA_CELL if value is None else f"{int(value):<20}"
+    padded_suffix = f"{suffix:<20}"
+    return lambda value: _NA_CELL if value is None else format(value, fmt) + padded_suffix
 
 
 class ModelComparator:
@@ -13,11 +65,13 @@ class ModelComparator:
 
     def __init__(self, results_dir: str = "results"):
         self.results_dir = results_dir
+        # Per comparator, so it uses this instance's (or a subclass's) loader
+        # and summariser; keyed by file path, mtime and size
+        self._cached_summary = lru_cache(maxsize=256)(self._read_summary)
 
     def load_result_file(self, filepath: str) -> Dict[str, Any]:
         """Load a single benchmark result file."""
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        return json_utils.load_file(filepath)
 
     def calculate_summary_stats(self, results_data: Dict[str, Any]) -> Dict[str, float]:
         """Calculate summary statistics from a result file."""
@@ -26,38 +80,88 @@ class ModelComparator:
         if not results:
             return {}
 
-        valid_evals = [r["evaluation"] for r in results if r.get("evaluation")]
-
-        if not valid_evals:
+        # Pull every metric out of the evaluations in a single pass, one
+        # packed float column per score
+        syntax, similarity, structure, bleu, semantic = (array('d') for _ in range(5))
+        compilable = non_compilable = empty_count = 0
+        total_response_time = 0
+        for r in results:
+            total_response_time += r.get("response_time", 0)
+            e = r.get("evaluation")
+            if not e:
+                continue
+            syntax.append(e["syntax_score"])
+            similarity.append(e["similarity_score"])
+            structure.append(e["structure_score"])
+            bleu.append(e.get("bleu_score", 0))
+            semantic.append(e.get("semantic_score", 0))
+            compiled = e.get("compilable")
+            if compiled is True:
+                compilable += 1
+            elif compiled is False:
+                non_compilable += 1
+            if (e.get("metrics") or _EMPTY).get("generated_empty", False):
+                empty_count += 1
+
+        evaluated = len(syntax)
+        if not evaluated:
             return {}
 
+        total_tests = results_data.get("total_tests", 0)
+        passed = results_data.get("passed", 0)
         stats = {
-            "total_tests": results_data.get("total_tests", 0),
-            "passed": results_data.get("passed", 0),
+            "total_tests": total_tests,
+            "passed": passed,
             "failed": results_data.get("failed", 0),
-            "pass_rate": results_data.get("passed", 0) / max(results_data.get("total_tests", 1), 1) * 100,
-            "avg_syntax": sum(e["syntax_score"] for e in valid_evals) / len(valid_evals),
-            "avg_similarity": sum(e["similarity_score"] for e in valid_evals) / len(valid_evals),
-            "avg_structure": sum(e["structure_score"] for e in valid_evals) / len(valid_evals),
-            "avg_bleu": sum(e.get("bleu_score", 0) for e in valid_evals) / len(valid_evals),
-            "avg_semantic": sum(e.get("semantic_score", 0) for e in valid_evals) / len(valid_evals),
-            "avg_response_time": sum(r.get("response_time", 0) for r in results) / len(results),
+            "pass_rate": passed / max(total_tests, 1) * 100,
+            "avg_syntax": sum(syntax) / evaluated,
+            "avg_similarity": sum(similarity) / evaluated,
+            "avg_structure": sum(structure) / evaluated,
+            "avg_bleu": sum(bleu) / evaluated,
+            "avg_semantic": sum(semantic) / evaluated,
+            "avg_response_time": total_response_time / len(results),
         }
 
         # Calculate compilation rate
-        compilable = sum(1 for e in valid_evals if e.get("compilable") is True)
-        non_compilable = sum(1 for e in valid_evals if e.get("compilable") is False)
         if compilable + non_compilable > 0:
             stats["compilation_rate"] = compilable / (compilable + non_compilable) * 100
         else:
             stats["compilation_rate"] = None
 
         # Calculate empty response rate
-        empty_count = sum(1 for e in valid_evals if e.get("metrics", {}).get("generated_empty", False))
-        stats["empty_response_rate"] = empty_count / len(valid_evals) * 100
+        stats["empty_response_rate"] = empty_count / evaluated * 100
 
         return stats
 
+    def _summarize_file(self, filepath: str) -> Tuple[Dict[str, Any], str]:
+        """Return the summary stats and timestamp of a result file, reusing earlier parses."""
+        st = os.stat(filepath)
+        return self._cached_summary(filepath, st.st_mtime_ns, st.st_size)
+
+    def _read_summary(self, filepath: str, mtime_ns: int, size: int) -> Tuple[Dict[str, Any], str]:
+        """Load and summarize one version of a result file."""
+        data = self.load_result_file(filepath)
+        return self.calculate_summary_stats(data), data.get("timestamp", "unknown")
+
+    def _load_all_stats(self, result_files: List[str], labels: List[str]) -> List[Dict[str, Any]]:
+        """Load result files concurrently and return their labelled stats in input order."""
+        pairs = list(zip(result_files, labels))
+        if not pairs:
+            return []
+
+        # Reading and parsing one file does not depend on any other
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(pairs))) as executor:
+            summaries = list(executor.map(self._summarize_file, [filepath for filepath, _ in pairs]))
+
+        all_stats = []
+        for (cached_stats, timestamp), (_, label) in zip(summaries, pairs):
+            # Copy, since the report adds keys such as composite_score
+            stats = dict(cached_stats)
+            stats["label"] = label
+            stats["timestamp"] = timestamp
+            all_stats.append(stats)
+        return all_stats
+
     def compare_results(self, result_files: List[str], labels: List[str] = None) -> str:
         """
         Compare multiple result files and generate a comparison report.
@@ -69,6 +173,23 @@ class ModelComparator:
         Returns:
             Formatted comparison report as string
         """
+        # Generate comparison report
+        report = self._generate_comparison_report(self._load_labelled_stats(result_files, labels))
+        return report
+
+    def print_comparison(self, result_files: List[str], labels: List[str] = None, file: TextIO = None):
+        """
+        Compare multiple result files and write the report as it is generated.
+
+        Args:
+            result_files: List of paths to result JSON files
+            labels: Optional labels for each result file
+            file: Text stream to write to, stdout by default
+        """
+        self.write_comparison_report(self._load_labelled_stats(result_files, labels), file)
+
+    def _load_labelled_stats(self, result_files: List[str], labels: List[str] = None) -> List[Dict[str, Any]]:
+        """Check the labels against the result files and load the stats of every file."""
         if labels is None:
             labels = [f"Model {i+1}" for i in range(len(result_files))]
 
@@ -76,32 +197,21 @@ class ModelComparator:
             raise ValueError("Number of labels must match number of result files")
 
         # Load all results
-        all_stats = []
-        for filepath, label in zip(result_files, labels):
-            data = self.load_result_file(filepath)
-            stats = self.calculate_summary_stats(data)
-            stats["label"] = label
-            stats["timestamp"] = data.get("timestamp", "unknown")
-            all_stats.append(stats)
+        return self._load_all_stats(result_files, labels)
 
-        # Generate comparison report
-        report = self._generate_comparison_report(all_stats)
-        return report
-
-    def _generate_comparison_report(self, all_stats: List[Dict[str, Any]]) -> str:
-        """Generate a formatted comparison report."""
-        lines = []
-        lines.append("=" * 80)
-        lines.append("MODEL COMPARISON REPORT")
-        lines.append("=" * 80)
-        lines.append("")
+    def _iter_report_lines(self, all_stats: List[Dict[str, Any]]) -> Iterator[str]:
+        """Yield the lines of the formatted comparison report."""
+        yield "=" * 80
+        yield "MODEL COMPARISON REPORT"
+        yield "=" * 80
+        yield ""
 
         # Summary table
-        lines.append("SUMMARY")
-        lines.append("-" * 80)
+        yield "SUMMARY"
+        yield "-" * 80
         header = f"{'Metric':<25}" + "".join(f"{s['label']:<20}" for s in all_stats)
-        lines.append(header)
-        lines.append("-" * 80)
+        yield header
+        yield "-" * 80
 
         metrics = [
             ("Total Tests", "total_tests", "d"),
@@ -118,24 +228,15 @@ class ModelComparator:
         ]
 
         for metric_name, key, fmt, *suffix in metrics:
-            suffix = suffix[0] if suffix else ""
-            row = f"{metric_name:<25}"
-            for stats in all_stats:
-                value = stats.get(key)
-                if value is None:
-                    row += f"{'N/A':<20}"
-                elif fmt == "d":
-                    row += f"{int(value):<20}"
-                else:
-                    row += f"{value:{fmt}}{suffix:<20}"
-            lines.append(row)
+            format_cell = _cell_formatter(fmt, suffix[0] if suffix else "")
+            yield f"{metric_name:<25}" + "".join(format_cell(stats.get(key)) for stats in all_stats)
 
-        lines.append("-" * 80)
-        lines.append("")
+        yield "-" * 80
+        yield ""
 
         # Best performer in each category
-        lines.append("BEST PERFORMERS")
-        lines.append("-" * 80)
+        yield "BEST PERFORMERS"
+        yield "-" * 80
 
         best_metrics = [
             ("Highest Pass Rate", "pass_rate", True),
@@ -154,47 +255,41 @@ class ModelComparator:
                 else:
                     best = min(valid_stats, key=lambda x: x[key])
 
-                value = best[key]
-                if key in ["pass_rate", "compilation_rate", "empty_response_rate"]:
-                    value_str = f"{value:.1f}%"
-                elif key == "avg_response_time":
-                    value_str = f"{value:.2f}s"
-                else:
-                    value_str = f"{value:.1f}"
+                value_str = _VALUE_FORMATTERS.get(key, _format_score)(best[key])
 
-                lines.append(f"{metric_name:<30} {best['label']:<20} ({value_str})")
+                yield f"{metric_name:<30} {best['label']:<20} ({value_str})"
 
-        lines.append("-" * 80)
-        lines.append("")
+        yield "-" * 80
+        yield ""
 
         # Recommendations
-        lines.append("RECOMMENDATIONS")
-        lines.append("-" * 80)
-        lines.append("")
+        yield "RECOMMENDATIONS"
+        yield "-" * 80
+        yield ""
 
         # Find the best overall model
         valid_with_bleu = [s for s in all_stats if s.get("avg_bleu") is not None]
         if valid_with_bleu:
             # Score based on: 30% BLEU, 30% Semantic, 20% Compilation, 20% Pass Rate
             for stats in valid_with_bleu:
-                comp_rate = stats.get("compilation_rate")
+                bleu, semantic, comp_rate, pass_rate = _composite_inputs(stats)
                 if comp_rate is None:
                     comp_rate = 0
                 stats["composite_score"] = (
-                    stats.get("avg_bleu", 0) * 0.3 +
-                    stats.get("avg_semantic", 0) * 0.3 +
+                    bleu * 0.3 +
+                    semantic * 0.3 +
                     comp_rate * 0.2 +
-                    stats.get("pass_rate", 0) * 0.2
+                    pass_rate * 0.2
                 )
 
             best_overall = max(valid_with_bleu, key=lambda x: x["composite_score"])
-            lines.append(f"Best Overall Model: {best_overall['label']}")
-            lines.append(f"  Composite Score: {best_overall['composite_score']:.1f}/100")
-            lines.append("")
+            yield f"Best Overall Model: {best_overall['label']}"
+            yield f"  Composite Score: {best_overall['composite_score']:.1f}/100"
+            yield ""
 
         # Specific recommendations
         for stats in all_stats:
-            lines.append(f"Model: {stats['label']}")
+            yield f"Model: {stats['label']}"
 
             issues = []
             if stats.get("avg_syntax", 0) < 60:
@@ -211,41 +306,40 @@ class ModelComparator:
                 issues.append("  - Overall: Fundamental improvements needed across all metrics")
 
             if issues:
-                lines.append("  Areas for Improvement:")
-                lines.extend(issues)
+                yield "  Areas for Improvement:"
+                yield from issues
             else:
-                lines.append("  Status: Performing well across all metrics")
-            lines.append("")
+                yield "  Status: Performing well across all metrics"
+            yield ""
 
-        lines.append("=" * 80)
+        yield "=" * 80
 
-        return "\n".join(lines)
+    def _generate_comparison_report(self, all_stats: List[Dict[str, Any]]) -> str:
+        """Generate a formatted comparison report."""
+        return "\n".join(self._iter_report_lines(all_stats))
+
+    def write_comparison_report(self, all_stats: List[Dict[str, Any]], file: TextIO = None):
+        """Write the comparison report line by line to file (stdout by default)."""
+        if file is None:
+            file = sys.stdout
+        file.writelines(line + "\n" for line in self._iter_report_lines(all_stats))
 
     def export_to_csv(self, result_files: List[str], labels: List[str], output_file: str):
         """Export comparison to CSV format."""
         import csv
 
-        all_stats = []
-        for filepath, label in zip(result_files, labels):
-            data = self.load_result_file(filepath)
-            stats = self.calculate_summary_stats(data)
-            stats["label"] = label
-            stats["timestamp"] = data.get("timestamp", "unknown")
-            all_stats.append(stats)
+        all_stats = self._load_all_stats(result_files, labels)
 
         with open(output_file, 'w', newline='') as f:
             if not all_stats:
                 return
 
-            # Collect all possible fields from all stats
-            all_fields = set()
-            for stats in all_stats:
-                all_fields.update(stats.keys())
-
-            fieldnames = ["label", "timestamp"] + sorted(all_fields - {"label", "timestamp"})
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(all_stats)
+            fieldnames = ["label", "timestamp", *STATS_FIELDS]
+            # Plain rows in field order; missing values become empty cells as with DictWriter
+            rows = [[stats.get(name, "") for name in fieldnames] for stats in all_stats]
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
 
         print(f"Comparison exported to: {output_file}")
 
@@ -265,25 +359,34 @@ def main():
     if sys.argv[1] == "--all":
         # Find all result files
         results_dir = "results"
-        result_file_paths = sorted(Path(results_dir).glob("benchmark_results_*.json"))
-
-        if not result_file_paths:
+        try:
+            with os.scandir(results_dir) as it:
+                entries = [
+                    e for e in it
+                    if e.name.startswith("benchmark_results_") and e.name.endswith(".json") and e.is_file()
+                ]
+        except FileNotFoundError:
+            entries = []
+
+        if not entries:
             print(f"No benchmark results found in {results_dir}")
             return
 
-        result_files = [str(f) for f in result_file_paths]
-        labels = [f"Run {i+1} ({Path(f).stem.split('_')[-2]})" for i, f in enumerate(result_files)]
+        entries.sort(key=lambda e: e.name)
+        result_files = [e.path for e in entries]
+        # Names look like benchmark_results_<date>_<time>.json
+        labels = [f"Run {i+1} ({e.name[:-len('.json')].split('_')[-2]})" for i, e in enumerate(entries)]
     else:
         result_files = sys.argv[1:]
         labels = [f"Model {i+1}" for i in range(len(result_files))]
 
     print(f"Comparing {len(result_files)} benchmark runs...\n")
 
-    # Generate comparison report
-    report = comparator.compare_results(result_files, labels)
-    print(report)
+    # Write the comparison report as it is generated
+    comparator.print_comparison(result_files, labels)
 
     # Export to CSV
+    from datetime import datetime  # Not needed on the usage path
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     csv_file = f"results/comparison_{timestamp}.csv"
     comparator.export_to_csv(result_files, labels, csv_file)
@@ -26,7 +26,15 @@ TEST_CASES = [
 
 # API Configuration
 REQUEST_TIMEOUT = 120  # seconds (increased for translation tasks)
+GENERATION_TIMEOUT = 600  # seconds to wait for a whole non-streamed translation
 MAX_RETRIES = 3
+BASE_BACKOFF = 1.0  # seconds, doubled on every retry
+MAX_BACKOFF = 30.0  # seconds, upper bound for a single retry delay
+MODELS_CACHE_TTL = 3600  # seconds a successful model availability check is reused
+
+# Benchmark execution
+MAX_WORKERS = 4  # test cases translated and evaluated concurrently
+SAVE_RAW_STREAMING = False  # keep each raw model output in results/streaming_logs/
 
 # System prompt used during model training
 SYSTEM_PROMPT = """
@@ -0,0 +1,38 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+import mmap
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
+
+# Files at least this large are parsed straight from a read-only memory map;
+# below it the mapping costs more than reading the bytes
+MMAP_THRESHOLD = 64 * 1024
+
+
+def loads(data: Any) -> Any:
+    """Parse JSON from str or UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, indented by two spaces if requested."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+def load_file(path: str) -> Any:
+    """Parse a JSON file, parsing large files from a memory map when orjson is available."""
+    with open(path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return loads(f.read())
@@ -1,9 +1,25 @@
 """Logging configuration for the benchmark pipeline."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from datetime import datetime
+
+# Listener writing the file handlers' records, kept so it can be replaced
+_queue_listener = None
+
+
+def _stop_queue_listener():
+    """Flush queued records to the log files and stop the writer thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 def setup_logging(log_level: str = "INFO", log_file: str = None) -> logging.Logger:
@@ -13,6 +29,9 @@ def setup_logging(log_level: str = "INFO", log_file: str = None) -> logging.Logg
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional path to log file. If None, logs to console only.
+            When set and stdout is not a terminal (output piped or
+            redirected), the console handler is skipped and records only go
+            to the file.
 
     Returns:
         Configured logger instance
@@ -25,6 +44,7 @@ def setup_logging(log_level: str = "INFO", log_file: str = None) -> logging.Logg
     logger.setLevel(numeric_level)
 
     # Remove existing handlers to avoid duplicates
+    _stop_queue_listener()
     logger.handlers.clear()
 
     # Create formatters
@@ -38,30 +58,43 @@ def setup_logging(log_level: str = "INFO", log_file: str = None) -> logging.Logg
         datefmt='%H:%M:%S'
     )
 
-    # Console handler (INFO and above)
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(simple_formatter)
-    logger.addHandler(console_handler)
+    # Console handler (INFO and above), unless the file already gets every
+    # record and nobody is watching the terminal
+    if log_file is None or sys.stdout.isatty():
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(simple_formatter)
+        logger.addHandler(console_handler)
 
     # File handler (DEBUG and above) - if log_file is specified
+    file_handlers = []
     if log_file:
         # Create log directory if it doesn't exist
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.FileHandler(log_file, mode='a')
+        # delay=True: the file is only opened by the first record written
+        file_handler = logging.FileHandler(log_file, mode='a', delay=True)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
+        file_handlers.append(file_handler)
 
     # Debug handler (DEBUG only) - separate file for detailed debugging
     if numeric_level == logging.DEBUG and log_file:
         debug_log = log_file.replace('.log', '_debug.log')
-        debug_handler = logging.FileHandler(debug_log, mode='a')
+        debug_handler = logging.FileHandler(debug_log, mode='a', delay=True)
         debug_handler.setLevel(logging.DEBUG)
         debug_handler.setFormatter(detailed_formatter)
-        logger.addHandler(debug_handler)
+        file_handlers.append(debug_handler)
+
+    # Log files are written by a listener thread; logging threads only
+    # enqueue the record
+    if file_handlers:
+        global _queue_listener
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _queue_listener = logging.handlers.QueueListener(log_queue, *file_handlers, respect_handler_level=True)
+        _queue_listener.start()
 
     logger.propagate = False
 
@@ -85,6 +118,8 @@ def get_logger(name: str = None) -> logging.Logger:
 
 def get_default_log_file() -> str:
     """Get default log file path with timestamp."""
+    from datetime import datetime  # Only needed here, so not imported with the module
+
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_dir = Path(__file__).parent / "results" / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
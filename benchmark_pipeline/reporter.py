@@ -1,70 +1,17 @@
 """Generate detailed reports from benchmark results."""
 
-import json
 import os
-from pathlib import Path
-from typing import List, Dict, Any
+import sys
+from functools import cached_property, lru_cache
+from html import escape
+from typing import List, Dict, Any, Iterator, Tuple
 from datetime import datetime
 
+import json_utils
 
-class BenchmarkReporter:
-    """Generates reports from benchmark results."""
-
-    def __init__(self, results_file: str):
-        """Initialize reporter with a results file."""
-        with open(results_file, 'r') as f:
-            self.data = json.load(f)
-        self.results_file = results_file
-        self.results_dir = os.path.dirname(results_file)
-
-    def generate_html_report(self, output_file: str = None) -> str:
-        """Generate an HTML report with visualizations."""
-        if output_file is None:
-            timestamp = self.data.get("timestamp", "unknown")
-            output_file = os.path.join(self.results_dir, f"report_{timestamp}.html")
-
-        html = self._build_html()
-
-        with open(output_file, 'w') as f:
-            f.write(html)
 
-        print(f"HTML report generated: {output_file}")
-        return output_file
-
-    def _build_html(self) -> str:
-        """Build the HTML report."""
-        results = self.data.get("results", [])
-        timestamp = self.data.get("timestamp", "Unknown")
-        total = self.data.get("total_tests", 0)
-        passed = self.data.get("passed", 0)
-        failed = self.data.get("failed", 0)
-
-        # Calculate averages
-        avg_syntax = 0
-        avg_similarity = 0
-        avg_structure = 0
-        avg_bleu = 0
-        avg_semantic = 0
-        avg_response_time = 0
-        compilation_rate = 0
-
-        if results:
-            valid_evals = [r for r in results if r.get("evaluation")]
-            if valid_evals:
-                avg_syntax = sum(r["evaluation"]["syntax_score"] for r in valid_evals) / len(valid_evals)
-                avg_similarity = sum(r["evaluation"]["similarity_score"] for r in valid_evals) / len(valid_evals)
-                avg_structure = sum(r["evaluation"]["structure_score"] for r in valid_evals) / len(valid_evals)
-                avg_bleu = sum(r["evaluation"].get("bleu_score", 0) for r in valid_evals) / len(valid_evals)
-                avg_semantic = sum(r["evaluation"].get("semantic_score", 0) for r in valid_evals) / len(valid_evals)
-
-                # Calculate compilation rate
-                compilable = sum(1 for r in valid_evals if r["evaluation"].get("compilable") is True)
-                non_compilable = sum(1 for r in valid_evals if r["evaluation"].get("compilable") is False)
-                if compilable + non_compilable > 0:
-                    compilation_rate = compilable / (compilable + non_compilable) * 100
-            avg_response_time = sum(r.get("response_time", 0) for r in results) / len(results)
-
-        html = f"""
+# Static part of the HTML report, up to and including the page title
+_HTML_HEAD = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -72,98 +19,98 @@ class BenchmarkReporter:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Solidity to Move Translation Benchmark Report</title>
     <style>
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
             margin: 0;
             padding: 20px;
             background: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             padding: 30px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
+        }
+        h1 {
             color: #333;
             border-bottom: 3px solid #4CAF50;
             padding-bottom: 10px;
-        }}
-        h2 {{
+        }
+        h2 {
             color: #555;
             margin-top: 30px;
-        }}
-        .summary {{
+        }
+        .summary {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin: 20px 0;
-        }}
-        .metric-card {{
+        }
+        .metric-card {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        .metric-card.success {{
+        }
+        .metric-card.success {
             background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
-        }}
-        .metric-card.fail {{
+        }
+        .metric-card.fail {
             background: linear-gradient(135deg, #eb3349 0%, #f45c43 100%);
-        }}
-        .metric-card h3 {{
+        }
+        .metric-card h3 {
             margin: 0 0 10px 0;
             font-size: 14px;
             opacity: 0.9;
-        }}
-        .metric-card .value {{
+        }
+        .metric-card .value {
             font-size: 32px;
             font-weight: bold;
             margin: 0;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 20px 0;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 12px;
             text-align: left;
             border-bottom: 1px solid #ddd;
-        }}
-        th {{
+        }
+        th {
             background-color: #f8f9fa;
             font-weight: 600;
             color: #333;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background-color: #f8f9fa;
-        }}
-        .score {{
+        }
+        .score {
             display: inline-block;
             padding: 4px 8px;
             border-radius: 4px;
             font-weight: 500;
-        }}
-        .score.high {{ background: #d4edda; color: #155724; }}
-        .score.medium {{ background: #fff3cd; color: #856404; }}
-        .score.low {{ background: #f8d7da; color: #721c24; }}
-        .pass {{ color: #28a745; font-weight: bold; }}
-        .fail {{ color: #dc3545; font-weight: bold; }}
-        .timestamp {{
+        }
+        .score.high { background: #d4edda; color: #155724; }
+        .score.medium { background: #fff3cd; color: #856404; }
+        .score.low { background: #f8d7da; color: #721c24; }
+        .pass { color: #28a745; font-weight: bold; }
+        .fail { color: #dc3545; font-weight: bold; }
+        .timestamp {
             color: #666;
             font-size: 14px;
-        }}
-        .chart-container {{
+        }
+        .chart-container {
             margin: 30px 0;
             padding: 20px;
             background: #f8f9fa;
             border-radius: 8px;
-        }}
-        .bar {{
+        }
+        .bar {
             height: 30px;
             background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
             border-radius: 4px;
@@ -173,13 +120,17 @@ class BenchmarkReporter:
             padding-left: 10px;
             color: white;
             font-weight: 500;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <h1>Solidity to Move Translation Benchmark Report</h1>
-        <p class="timestamp">Generated: {timestamp}</p>
+"""
+
+# Summary cards, average score bars and the results table header; filled
+# with str.format
+_HTML_SUMMARY = """        <p class="timestamp">Generated: {timestamp}</p>
 
         <div class="summary">
             <div class="metric-card">
@@ -196,7 +147,7 @@ class BenchmarkReporter:
             </div>
             <div class="metric-card">
                 <h3>Success Rate</h3>
-                <p class="value">{(passed/total*100 if total > 0 else 0):.1f}%</p>
+                <p class="value">{success_rate:.1f}%</p>
             </div>
         </div>
 
@@ -251,67 +202,180 @@ class BenchmarkReporter:
             <tbody>
 """
 
-        for result in results:
-            test_case = result.get("test_case", "Unknown")
-            success = result.get("success", False)
-            error = result.get("error")
-            response_time = result.get("response_time", 0)
-            evaluation = result.get("evaluation")
+# Closes the results table and the document
+_HTML_TAIL = """
+            </tbody>
+        </table>
+    </div>
+</body>
+</html>
+"""
 
-            if evaluation:
-                passed = evaluation.get("passed", False)
-                syntax = evaluation.get("syntax_score", 0)
-                similarity = evaluation.get("similarity_score", 0)
-                structure = evaluation.get("structure_score", 0)
-                bleu = evaluation.get("bleu_score", 0)
-                semantic = evaluation.get("semantic_score", 0)
-                compilable = evaluation.get("compilable")
-
-                status_class = "pass" if passed else "fail"
-                status_text = "PASS" if passed else "FAIL"
-
-                def score_class(score):
-                    if score >= 70:
-                        return "high"
-                    elif score >= 40:
-                        return "medium"
-                    else:
-                        return "low"
-
-                compilable_text = "Yes" if compilable is True else ("No" if compilable is False else "N/A")
-                compilable_class = "pass" if compilable is True else ("fail" if compilable is False else "")
-
-                html += f"""
+def _score_class(score: float) -> str:
+    """Badge class of a 0-100 score: high from 70, medium from 40, low below."""
+    return "high" if score >= 70 else "medium" if score >= 40 else "low"
+
+
+def _format_row(result: Dict[str, Any]) -> str:
+    """Format the results table row of one test case."""
+    test_case = result.get("test_case", "Unknown")
+    success = result.get("success", False)
+    error = result.get("error")
+    response_time = result.get("response_time", 0)
+    evaluation = result.get("evaluation")
+
+    if evaluation:
+        passed = evaluation.get("passed", False)
+        syntax = evaluation.get("syntax_score", 0)
+        similarity = evaluation.get("similarity_score", 0)
+        structure = evaluation.get("structure_score", 0)
+        bleu = evaluation.get("bleu_score", 0)
+        semantic = evaluation.get("semantic_score", 0)
+        compilable = evaluation.get("compilable")
+
+        status_class = "pass" if passed else "fail"
+        status_text = "PASS" if passed else "FAIL"
+
+        compilable_text = "Yes" if compilable is True else ("No" if compilable is False else "N/A")
+        compilable_class = "pass" if compilable is True else ("fail" if compilable is False else "")
+
+        return f"""
                 <tr>
                     <td>{test_case}</td>
                     <td class="{status_class}">{status_text}</td>
-                    <td><span class="score {score_class(syntax)}">{syntax:.1f}</span></td>
-                    <td><span class="score {score_class(similarity)}">{similarity:.1f}</span></td>
-                    <td><span class="score {score_class(structure)}">{structure:.1f}</span></td>
-                    <td><span class="score {score_class(bleu)}">{bleu:.1f}</span></td>
-                    <td><span class="score {score_class(semantic)}">{semantic:.1f}</span></td>
+                    <td><span class="score {_score_class(syntax)}">{syntax:.1f}</span></td>
+                    <td><span class="score {_score_class(similarity)}">{similarity:.1f}</span></td>
+                    <td><span class="score {_score_class(structure)}">{structure:.1f}</span></td>
+                    <td><span class="score {_score_class(bleu)}">{bleu:.1f}</span></td>
+                    <td><span class="score {_score_class(semantic)}">{semantic:.1f}</span></td>
                     <td class="{compilable_class}">{compilable_text}</td>
                     <td>{response_time:.2f}s</td>
                 </tr>
 """
-            else:
-                html += f"""
+    else:
+        # Error messages come from exceptions and API responses, so they
+        # are the one escaped field; test case names are the benchmark's
+        # own folder names and the other cells are numbers or fixed text
+        return f"""
                 <tr>
                     <td>{test_case}</td>
                     <td class="fail">ERROR</td>
-                    <td colspan="4">{error or 'Unknown error'}</td>
+                    <td colspan="4">{escape(str(error)) if error else 'Unknown error'}</td>
                 </tr>
 """
 
-        html += """
-            </tbody>
-        </table>
-    </div>
-</body>
-</html>
-"""
 
-        return html
+class BenchmarkReporter:
+    """Generates reports from benchmark results."""
+
+    def __init__(self, results_file: str):
+        """Initialize reporter with a results file; it is parsed on first use."""
+        self.results_file = results_file
+        self.results_dir = os.path.dirname(results_file)
+        # (data, html) of the last render, reused while self.data is unchanged
+        self._html_cache = None
+
+    @cached_property
+    def data(self) -> Dict[str, Any]:
+        """The parsed results file, loaded the first time a report needs it."""
+        return _load_results(*_file_key(self.results_file))
+
+    def generate_html_report(self, output_file: str = None) -> str:
+        """Generate an HTML report with visualizations."""
+        # The output name and the page both come from self.data
+        if output_file is None:
+            timestamp = self.data.get("timestamp", "unknown")
+            output_file = os.path.join(self.results_dir, f"report_{timestamp}.html")
+
+        html = self._rendered_html()
+
+        # UTF-8 matches the page's meta charset
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(html)
+
+        print(f"HTML report generated: {output_file}")
+        return output_file
+
+    def _rendered_html(self) -> str:
+        """Return the HTML report of self.data, rebuilt only when data is replaced."""
+        data = self.data
+        if self._html_cache is None or self._html_cache[0] is not data:
+            self._html_cache = (data, self._build_html())
+        return self._html_cache[1]
+
+    def _build_html(self) -> str:
+        """Build the HTML report."""
+        return "".join(self._iter_html())
+
+    def _iter_html(self) -> Iterator[str]:
+        """Yield the HTML report piece by piece, one piece per results table row."""
+        results = self.data.get("results", [])
+        timestamp = self.data.get("timestamp", "Unknown")
+        total = self.data.get("total_tests", 0)
+        passed = self.data.get("passed", 0)
+        failed = self.data.get("failed", 0)
+
+        # Calculate averages in a single pass over the results. The sums
+        # start from int 0 like sum(), so an empty report renders as before.
+        avg_syntax = 0
+        avg_similarity = 0
+        avg_structure = 0
+        avg_bleu = 0
+        avg_semantic = 0
+        avg_response_time = 0
+        compilation_rate = 0
+
+        if results:
+            sum_syntax = sum_similarity = sum_structure = sum_bleu = sum_semantic = 0
+            total_response_time = 0
+            evaluated = compilable = non_compilable = 0
+            for r in results:
+                total_response_time += r.get("response_time", 0)
+                ev = r.get("evaluation")
+                if not ev:
+                    continue
+                evaluated += 1
+                ev_get = ev.get
+                sum_syntax += ev["syntax_score"]
+                sum_similarity += ev["similarity_score"]
+                sum_structure += ev["structure_score"]
+                sum_bleu += ev_get("bleu_score", 0)
+                sum_semantic += ev_get("semantic_score", 0)
+                compiled = ev_get("compilable")
+                if compiled is True:
+                    compilable += 1
+                elif compiled is False:
+                    non_compilable += 1
+
+            if evaluated:
+                avg_syntax = sum_syntax / evaluated
+                avg_similarity = sum_similarity / evaluated
+                avg_structure = sum_structure / evaluated
+                avg_bleu = sum_bleu / evaluated
+                avg_semantic = sum_semantic / evaluated
+
+                # Calculate compilation rate
+                if compilable + non_compilable > 0:
+                    compilation_rate = compilable / (compilable + non_compilable) * 100
+            avg_response_time = total_response_time / len(results)
+
+        yield _HTML_HEAD
+        yield _HTML_SUMMARY.format(
+            timestamp=timestamp,
+            total=total,
+            passed=passed,
+            failed=failed,
+            success_rate=passed / total * 100 if total > 0 else 0,
+            avg_syntax=avg_syntax,
+            avg_similarity=avg_similarity,
+            avg_structure=avg_structure,
+            avg_bleu=avg_bleu,
+            avg_semantic=avg_semantic,
+            compilation_rate=compilation_rate,
+            avg_response_time=avg_response_time,
+        )
+        yield from map(_format_row, results)
+        yield _HTML_TAIL
 
     def print_detailed_report(self):
         """Print a detailed text report to console."""
@@ -321,57 +385,88 @@ class BenchmarkReporter:
 
         results = self.data.get("results", [])
 
+        # Each test case's lines are written to stdout in one call
+        write = sys.stdout.write
         for result in results:
-            print(f"\n{'=' * 80}")
-            print(f"Test Case: {result.get('test_case')}")
-            print(f"{'=' * 80}")
+            lines = [
+                f"\n{'=' * 80}",
+                f"Test Case: {result.get('test_case')}",
+                f"{'=' * 80}",
+            ]
 
             if not result.get("success"):
-                print(f"Status: FAILED")
-                print(f"Error: {result.get('error')}")
+                lines.append(f"Status: FAILED")
+                lines.append(f"Error: {result.get('error')}")
+                write("\n".join(lines) + "\n")
                 continue
 
-            print(f"Status: SUCCESS")
-            print(f"Response Time: {result.get('response_time', 0):.2f}s")
+            lines.append(f"Status: SUCCESS")
+            lines.append(f"Response Time: {result.get('response_time', 0):.2f}s")
 
             evaluation = result.get("evaluation")
             if evaluation:
-                print(f"\nEvaluation Scores:")
-                print(f"  Syntax:     {evaluation.get('syntax_score', 0):.1f}/100")
-                print(f"  Similarity: {evaluation.get('similarity_score', 0):.1f}/100")
-                print(f"  Structure:  {evaluation.get('structure_score', 0):.1f}/100")
-                print(f"  BLEU:       {evaluation.get('bleu_score', 0):.1f}/100")
-                print(f"  Semantic:   {evaluation.get('semantic_score', 0):.1f}/100")
+                lines.append(f"\nEvaluation Scores:")
+                lines.append(f"  Syntax:     {evaluation.get('syntax_score', 0):.1f}/100")
+                lines.append(f"  Similarity: {evaluation.get('similarity_score', 0):.1f}/100")
+                lines.append(f"  Structure:  {evaluation.get('structure_score', 0):.1f}/100")
+                lines.append(f"  BLEU:       {evaluation.get('bleu_score', 0):.1f}/100")
+                lines.append(f"  Semantic:   {evaluation.get('semantic_score', 0):.1f}/100")
                 compilable = evaluation.get('compilable')
                 if compilable is not None:
-                    print(f"  Compilable: {'Yes' if compilable else 'No'}")
-                print(f"  Overall:    {'PASS' if evaluation.get('passed') else 'FAIL'}")
+                    lines.append(f"  Compilable: {'Yes' if compilable else 'No'}")
+                lines.append(f"  Overall:    {'PASS' if evaluation.get('passed') else 'FAIL'}")
 
                 metrics = evaluation.get('metrics', {})
-                print(f"\nMetrics:")
-                print(f"  Generated Lines: {metrics.get('generated_lines', 0)}")
-                print(f"  Reference Lines: {metrics.get('reference_lines', 0)}")
-                print(f"  Has Module: {metrics.get('has_module_declaration', False)}")
-                print(f"  Struct Count (Gen/Ref): {metrics.get('struct_count_generated', 0)}/{metrics.get('struct_count_reference', 0)}")
-                print(f"  Function Count (Gen/Ref): {metrics.get('function_count_generated', 0)}/{metrics.get('function_count_reference', 0)}")
-                print(f"  Struct Match Ratio: {metrics.get('struct_match_ratio', 0):.1f}%")
-                print(f"  Function Match Ratio: {metrics.get('function_match_ratio', 0):.1f}%")
-                print(f"  Keyword Coverage: {metrics.get('keyword_coverage', 0):.1f}%")
-                print(f"  Exact Match: {metrics.get('exact_match', False)}")
-                print(f"  Generated Empty: {metrics.get('generated_empty', False)}")
+                lines.append(f"\nMetrics:")
+                lines.append(f"  Generated Lines: {metrics.get('generated_lines', 0)}")
+                lines.append(f"  Reference Lines: {metrics.get('reference_lines', 0)}")
+                lines.append(f"  Has Module: {metrics.get('has_module_declaration', False)}")
+                lines.append(f"  Struct Count (Gen/Ref): {metrics.get('struct_count_generated', 0)}/{metrics.get('struct_count_reference', 0)}")
+                lines.append(f"  Function Count (Gen/Ref): {metrics.get('function_count_generated', 0)}/{metrics.get('function_count_reference', 0)}")
+                lines.append(f"  Struct Match Ratio: {metrics.get('struct_match_ratio', 0):.1f}%")
+                lines.append(f"  Function Match Ratio: {metrics.get('function_match_ratio', 0):.1f}%")
+                lines.append(f"  Keyword Coverage: {metrics.get('keyword_coverage', 0):.1f}%")
+                lines.append(f"  Exact Match: {metrics.get('exact_match', False)}")
+                lines.append(f"  Generated Empty: {metrics.get('generated_empty', False)}")
+
+            write("\n".join(lines) + "\n")
+
+
+def _file_key(path: str) -> Tuple[str, int, int]:
+    """Return the path, mtime and size identifying a version of a results file."""
+    st = os.stat(path)
+    return path, st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=8)
+def _load_results(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a results file; cached per file path, mtime and size.
+
+    The parsed data is shared by every reporter of that file and must not be
+    modified.
+    """
+    return json_utils.load_file(path)
+
+
+# Flags accepted by main()
+REPORT_OPTIONS = frozenset({"--no-html", "--no-console"})
 
 
 def main():
     """Main entry point for generating reports from existing results."""
-    import sys
+    options = {arg for arg in sys.argv[1:] if arg.startswith("--")}
+    positional = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
 
-    if len(sys.argv) < 2:
-        print("Usage: python reporter.py <results_file.json>")
+    if not positional or options - REPORT_OPTIONS:
+        print("Usage: python reporter.py [--no-html] [--no-console] <results_file.json>")
         print("\nOr to generate report for the latest results:")
         print("  python reporter.py latest")
+        print("\nOptions:")
+        print("  --no-html     Only print the detailed report")
+        print("  --no-console  Only write the HTML report")
         return
 
-    results_file = sys.argv[1]
+    results_file = positional[0]
 
     if results_file == "latest":
         # Find the latest results file
@@ -380,21 +475,33 @@ def main():
             print("No results directory found.")
             return
 
-        json_files = list(Path(results_dir).glob("benchmark_results_*.json"))
-        if not json_files:
+        # Single directory scan, stat-ing each matching entry once
+        latest = None
+        latest_mtime = -1
+        with os.scandir(results_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("benchmark_results_") and name.endswith(".json"):
+                    mtime = entry.stat().st_mtime
+                    if mtime > latest_mtime:
+                        latest, latest_mtime = entry.path, mtime
+        if latest is None:
             print("No benchmark results found.")
             return
 
-        results_file = str(max(json_files, key=os.path.getmtime))
+        results_file = latest
         print(f"Using latest results: {results_file}")
 
     if not os.path.exists(results_file):
         print(f"Results file not found: {results_file}")
         return
 
+    # Only the requested reports are built
     reporter = BenchmarkReporter(results_file)
-    reporter.print_detailed_report()
-    reporter.generate_html_report()
+    if "--no-console" not in options:
+        reporter.print_detailed_report()
+    if "--no-html" not in options:
+        reporter.generate_html_report()
 
 
 if __name__ == "__main__":